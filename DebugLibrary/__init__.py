@@ -1,11 +1,32 @@
-from .keywords import DebugKeywords
+"""A debug library and REPL for RobotFramework."""
+
 from .version import VERSION
 
-"""A debug library and REPL for RobotFramework."""
+_library = None
+
+
+def __getattr__(name):
+    # the library imports robot, which clients of a shell server do not need
+    global _library
+    if name == "DebugKeywords":
+        from .keywords import DebugKeywords
+
+        return DebugKeywords
+    if name == "DebugLibrary":
+        if _library is None:
+            _library = _make_library()
+        return _library
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _make_library():
+    from .keywords import DebugKeywords
 
+    class DebugLibrary(DebugKeywords):
+        """Debug Library for RobotFramework."""
 
-class DebugLibrary(DebugKeywords):
-    """Debug Library for RobotFramework."""
+        ROBOT_LIBRARY_SCOPE = "GLOBAL"
+        ROBOT_LIBRARY_VERSION = VERSION
 
-    ROBOT_LIBRARY_SCOPE = "GLOBAL"
-    ROBOT_LIBRARY_VERSION = VERSION
+    DebugLibrary.__qualname__ = "DebugLibrary"
+    return DebugLibrary
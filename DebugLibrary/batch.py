@@ -0,0 +1,55 @@
+import json
+import sys
+from contextlib import contextmanager
+
+from robot.libraries.BuiltIn import BuiltIn
+from robot.running.signalhandler import STOP_SIGNAL_MONITOR
+
+from .debugcmd import execute_robot_command
+from .server import captured_output
+
+
+@contextmanager
+def open_batch(path):
+    """Open a file of keyword lines, ``-`` is stdin."""
+    if path == "-":
+        yield sys.stdin
+    else:
+        with open(path, encoding="utf-8") as batch_file:
+            yield batch_file
+
+
+def run_batch(path, output=None):
+    """Run keyword lines of a file one by one, without any prompt.
+
+    Each executed line writes one JSON object to output: its line number,
+    the command, PASS or FAIL status, the result or error and what the
+    keyword printed to the console. Blank lines and comments are skipped.
+    Returns the number of executed and failed lines.
+    """
+    output = output or sys.__stdout__
+    robot = BuiltIn()
+    executed = failed = 0
+    with open_batch(path) as lines:
+        for lineno, line in enumerate(lines, start=1):
+            command = line.strip()
+            if not command or command.startswith("#"):
+                continue
+            if STOP_SIGNAL_MONITOR._signal_count:
+                break  # Ctrl-C
+
+            with captured_output() as console:
+                result, error = execute_robot_command(robot, command)
+            record = {"line": lineno, "command": command}
+            if error:
+                failed += 1
+                record["status"] = "FAIL"
+                record["error"] = "{}: {}".format(*error)
+            else:
+                record["status"] = "PASS"
+                record["result"] = result[1] if result else None
+            record["console"] = console.getvalue()
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            executed += 1
+    return executed, failed
@@ -0,0 +1,163 @@
+import os
+import re
+
+from robot.utils import normalize
+
+from .conditions import is_true
+from .globals import context
+
+_LOCATION = re.compile(r"^(?P<path>.+):(?P<lineno>\d+)$")
+_SEPARATOR = re.compile(r"\s{2,}|\t")
+
+
+class BreakpointUsageError(ValueError):
+    pass
+
+
+class Breakpoint:
+    """Stop before a keyword, or before a step of a source line."""
+
+    __slots__ = ("number", "keyword", "path", "lineno", "condition", "hits")
+
+    def __init__(self, number, keyword=None, path=None, lineno=0, condition=None):
+        self.number = number
+        self.keyword = keyword
+        self.path = path
+        self.lineno = lineno
+        self.condition = condition
+        self.hits = 0
+
+    @property
+    def location(self):
+        if self.keyword:
+            return self.keyword
+        return f"{self.path}:{self.lineno}"
+
+    def matches_path(self, source):
+        return source == self.path or source.endswith(os.sep + self.path)
+
+    def __str__(self):
+        condition = f"  if  {self.condition}" if self.condition else ""
+        return f"{self.number}: {self.location}{condition} ({self.hits} hits)"
+
+
+def parse_breakpoint(number, args):
+    """Parse ``<keyword>|<file>:<line>[  if  <condition>]``."""
+    parts = _SEPARATOR.split(args.strip())
+    target = parts[0]
+    if not target:
+        raise BreakpointUsageError("no keyword or file:line to break at")
+    if len(parts) > 1 and parts[1].lower() == "if":
+        del parts[1]
+    condition = "  ".join(parts[1:]) or None
+
+    location = _LOCATION.match(target)
+    if location is None:
+        return Breakpoint(number, keyword=target, condition=condition)
+    path = os.path.expanduser(location.group("path"))
+    if os.path.exists(path):
+        path = os.path.abspath(path)
+    return Breakpoint(
+        number,
+        path=os.path.normpath(path),
+        lineno=int(location.group("lineno")),
+        condition=condition,
+    )
+
+
+def is_condition_true(condition):
+    """Evaluate a condition like ``Run Keyword If`` does.
+
+    A failing condition counts as true, to stop and show the problem.
+    """
+    try:
+        return is_true(condition)
+    except Exception as exc:
+        print(f"! breakpoint condition {condition!r} failed: {exc}")
+        return True
+
+
+class BreakpointTable:
+    """Breakpoints looked up by keyword name and by line number.
+
+    Keyword breakpoints are keyed by normalized name, line breakpoints by
+    line number, and normalized names of seen keywords are cached, so
+    checking a keyword which hits no breakpoint costs a few dict lookups.
+    """
+
+    def __init__(self):
+        self.breakpoints = {}
+        self.next_number = 1
+        self._keywords = {}
+        self._lines = {}
+        self._normalized = {}
+
+    def __len__(self):
+        return len(self.breakpoints)
+
+    def __iter__(self):
+        return iter(self.breakpoints.values())
+
+    def add(self, args):
+        point = parse_breakpoint(self.next_number, args)
+        self.next_number += 1
+        self.breakpoints[point.number] = point
+        self._rebuild()
+        return point
+
+    def remove(self, number):
+        point = self.breakpoints.pop(number, None)
+        self._rebuild()
+        return point
+
+    def clear(self):
+        self.breakpoints.clear()
+        self._rebuild()
+
+    def _rebuild(self):
+        self._keywords = {}
+        self._lines = {}
+        for point in self.breakpoints.values():
+            if point.keyword:
+                key = normalize(point.keyword, ignore="_")
+                self._keywords.setdefault(key, []).append(point)
+            else:
+                self._lines.setdefault(point.lineno, []).append(point)
+
+    def _normalize(self, name):
+        normalized = self._normalized.get(name)
+        if normalized is None:
+            normalized = self._normalized[name] = normalize(name, ignore="_")
+        return normalized
+
+    def candidates(self, name, kwname, locate):
+        """Yield breakpoints at a keyword, before checking conditions.
+
+        locate is only called with line breakpoints set, returning source
+        path and line number of the keyword.
+        """
+        if self._keywords:
+            yield from self._keywords.get(self._normalize(name), ())
+            if kwname and kwname != name:
+                yield from self._keywords.get(self._normalize(kwname), ())
+        if self._lines:
+            source, lineno = locate()
+            for point in self._lines.get(lineno, ()):
+                if source and point.matches_path(source):
+                    yield point
+
+    def match(self, name, kwname, locate):
+        """Get the first breakpoint hit by a keyword, None for no hit."""
+        for point in self.candidates(name, kwname, locate):
+            if point.condition and not is_condition_true(point.condition):
+                continue
+            point.hits += 1
+            return point
+        return None
+
+
+def get_breakpoints():
+    """Get the breakpoint table, shared by all shells."""
+    if context.breakpoints is None:
+        context.breakpoints = BreakpointTable()
+    return context.breakpoints
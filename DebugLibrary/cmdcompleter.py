@@ -1,34 +1,58 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left, bisect_right
+
 from prompt_toolkit.completion import Completer, Completion
 
-from .robotkeyword import parse_keyword, get_keywords
+from .robotkeyword import get_lib_keywords, parse_keyword
 from .robotlib import get_libs
+from .styles import print_error
+
+# maximum number of fuzzy completions
+FUZZY_LIMIT = 20
+
+
+class Command:
+    """Completion entry of a debug command or library."""
+
+    __slots__ = ("name", "meta")
+
+    def __init__(self, name, meta):
+        self.name = name
+        self.meta = meta
 
 
 def commands(helps):
-    _commands = [
-        (cmd_name, cmd_name, f"DEBUG command: {doc}") for cmd_name, doc in helps
+    return [
+        (cmd_name, Command(cmd_name, f"DEBUG command: {doc}"))
+        for cmd_name, doc in helps
     ]
 
-    # libraries
-    for lib in get_libs():
-        _commands.append((lib.name, lib.name, f"Library: {lib.name} {lib.version}",))
-
-    # keywords
-    for keyword in get_keywords():
-        # name with library
-        name = f'{keyword["lib"]}.{keyword["name"]}'
-        _commands.append((name, keyword["name"], f'Keyword: {keyword["summary"]}',))
-        # name without library
-        _commands.append(
-            (
-                keyword["name"],
-                keyword["name"],
-                f'Keyword[{keyword["lib"]}.]: {keyword["summary"]}',
-            )
-        )
+
+def library_commands(lib):
+    """Get completion names of a library and its keywords with their entries.
+
+    Keywords are their own entries, display texts are made only for the
+    completions shown.
+    """
+    _commands = [(lib.name, Command(lib.name, f"Library: {lib.name} {lib.version}"))]
+
+    # keywords, with and without library name
+    for keyword in get_lib_keywords(lib):
+        _commands.append((f"{keyword.lib}.{keyword.name}", keyword))
+        _commands.append((keyword.name, keyword))
     return _commands
 
 
+def get_display_meta(name, entry):
+    if isinstance(entry, Command):
+        return entry.meta
+    if name != entry.name:
+        return f"Keyword: {entry.summary}"  # name with library
+    return f"Keyword[{entry.lib}.]: {entry.summary}"
+
+
 def _get_argument_completions(completer, document):
     """Using Cmd.py's completer to complete arguments."""
     end_idx = document.cursor_position_col
@@ -44,19 +68,270 @@ def _get_argument_completions(completer, document):
         yield Completion(comp, begin_idx - end_idx, display=comp)
 
 
+class PrefixIndex:
+    """Names sorted by their lowercase form, to be searched by prefix.
+
+    Names are kept in groups, e.g. one per library, so that adding or
+    replacing a group only sorts its own names. Root level names and
+    ``Library.keyword`` names are kept apart, a lookup only walks the names
+    it returns.
+    """
+
+    def __init__(self, names=()):
+        self.groups = {}
+        if names:
+            self.set_group(None, names)
+
+    def set_group(self, group, names):
+        """Add or replace the names of a group."""
+        names = list(names)
+        self.groups[group] = (
+            self._sort(name for name in names if "." not in name),
+            self._sort(name for name in names if "." in name),
+        )
+
+    @staticmethod
+    def _sort(names):
+        entries = sorted({(name.lower().strip(), name) for name in names})
+        return [key for key, _ in entries], [name for _, name in entries]
+
+    @staticmethod
+    def _find(keys, names, prefix):
+        index = bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            yield keys[index], names[index]
+            index += 1
+
+    def find(self, text):
+        """Get names starting with lowercase text, in sorted order."""
+        part = 1 if "." in text else 0
+        prefix = text.strip()
+        runs = [
+            self._find(*groups[part], prefix) for groups in list(self.groups.values())
+        ]
+        previous = None
+        for entry in heapq.merge(*runs):
+            if entry != previous:  # the same name in several groups
+                yield entry[1]
+            previous = entry
+
+
+def normalize_words(name):
+    """Lowercase name with underscores and runs of spaces as one space."""
+    return " ".join(name.lower().replace("_", " ").split())
+
+
+def fuzzy_score(query, key):
+    """Score how well a query matches a name normalized by normalize_words.
+
+    Query characters must appear in order. Matches starting a word or
+    continuing the previous match score higher, skipped characters and
+    long names lower, so a run of consecutive characters beats the same
+    characters spread over word starts. Returns None if the query does
+    not match.
+    """
+    score = 0
+    position = 0
+    previous = None
+    for char in query:
+        index = key.find(char, position)
+        if index < 0:
+            return None
+        if previous is not None and (
+            index == previous + 1
+            or (index == previous + 2 and key[previous + 1] in " .")
+        ):
+            score += 5
+        elif index == 0:
+            score += 5
+        else:
+            word_start = key.find(" " + char, max(position - 1, 0))
+            if word_start >= 0:
+                index = word_start + 1
+                score += 5 - (index - position) * 0.1
+            else:
+                score -= index - position
+        previous = index
+        position = index + 1
+    return score - len(key) * 0.01
+
+
+class FuzzyIndex:
+    """Names searched by subsequence and word initials, best matches first.
+
+    Case, spaces and underscores are ignored like robot does. Candidates
+    come from one regex search over all names of a group joined together,
+    only those are scored and the top ``limit`` kept in a heap. Groups,
+    e.g. one per library, are added or replaced on their own.
+    ``Library.keyword`` names are matched by library prefix first, then
+    keyword.
+    """
+
+    def __init__(self, names=()):
+        self.groups = {}
+        if names:
+            self.set_group(None, names)
+
+    def set_group(self, group, names):
+        """Add or replace the names of a group."""
+        names = list(names)
+        libraries = {}
+        for name in names:
+            if "." in name:
+                library, _, keyword = name.partition(".")
+                libraries.setdefault(library, []).append(keyword)
+        self.groups[group] = (
+            _FuzzyNames(name for name in names if "." not in name),
+            {
+                library.lower(): (library, _FuzzyNames(keywords))
+                for library, keywords in libraries.items()
+            },
+        )
+
+    def find(self, text, limit=FUZZY_LIMIT):
+        """Get up to limit best matching names, best first."""
+        groups = list(self.groups.values())
+        if "." not in text:
+            matches = [
+                match for root, _ in groups for match in root.find(text, limit)
+            ]
+        else:
+            library_prefix, _, text = text.partition(".")
+            library_prefix = library_prefix.strip()
+            matches = [
+                (score, f"{library}.{name}")
+                for _, libraries in groups
+                for key, (library, names) in libraries.items()
+                if key.startswith(library_prefix)
+                for score, name in names.find(text, limit)
+            ]
+        best = {}
+        for score, name in matches:
+            best[name] = max(score, best.get(name, score))
+        # best score first, then in name order
+        return [
+            name
+            for name, _ in heapq.nsmallest(
+                limit, best.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+
+
+class _FuzzyNames:
+    def __init__(self, names):
+        self.names = sorted(set(names))
+        self.keys = [normalize_words(name) for name in self.names]
+        # every word starts after a space, which gives the regex a literal
+        # to search for
+        self.starts = []
+        offset = 0
+        for key in self.keys:
+            self.starts.append(offset)
+            offset += len(key) + 2
+        self.joined = "\n".join(" " + key for key in self.keys)
+
+    def find(self, text, limit):
+        query = text.lower().replace(" ", "").replace("_", "")
+        if len(query) < 2:
+            return []
+        pattern = " " + "[^\n]*?".join(map(re.escape, query))
+        candidates = {
+            bisect_right(self.starts, match.start()) - 1
+            for match in re.finditer(pattern, self.joined)
+        }
+        scored = []
+        for index in candidates:
+            score = fuzzy_score(query, self.keys[index])
+            if score is not None:
+                scored.append((score, -index))
+        return [
+            (score, self.names[-index])
+            for score, index in heapq.nlargest(limit, scored)
+        ]
+
+
 class CmdCompleter(Completer):
     """Completer for debug shell."""
 
     def __init__(self, cmd_repl=None):
-        self.commands = commands(cmd_repl.get_helps())
-        self.names = []
-        self.displays = {}
-        self.display_metas = {}
-        for name, display, display_meta in self.commands:
-            self.names.append(name)
-            self.displays[name] = display
-            self.display_metas[name] = display_meta
+        self.entries = {}
         self.cmd_repl = cmd_repl
+        self.command_names = self._add_commands(commands(cmd_repl.get_helps()))
+        self.index = PrefixIndex()
+        self.fuzzy_index = FuzzyIndex()
+        self._update_index(None, self.command_names)
+
+        # keywords of libraries are indexed in background, so that the
+        # prompt shows up at once and completions fill in as they are ready
+        self.on_update = None
+        self.indexed = {}
+        self.pending_libs = []
+        self.indexed_libs = 0
+        self.total_libs = 0
+        self._lock = threading.Lock()
+        self._indexing = None
+        self.update_libs()
+
+    def _add_commands(self, _commands):
+        self.entries.update(_commands)
+        return [name for name, _ in _commands]
+
+    def update_libs(self):
+        """Index libraries imported or reloaded since the last update."""
+        libs = [lib for lib in get_libs() if not self._is_indexed(lib)]
+        if not libs:
+            return
+        with self._lock:
+            for lib in libs:
+                self.indexed[lib.name] = (lib, lib.handlers)
+            self.pending_libs.extend(libs)
+            self.total_libs += len(libs)
+            if self._indexing is None:
+                self._indexing = threading.Thread(target=self._index_libs, daemon=True)
+                self._indexing.start()
+
+    def _update_index(self, group, names):
+        """Index names of the commands or of a library, replacing old ones."""
+        self.index.set_group(group, names)
+        self.fuzzy_index.set_group(group, names)
+
+    def _is_indexed(self, lib):
+        indexed_lib, handlers = self.indexed.get(lib.name, (None, None))
+        # reloading a library replaces its handlers
+        return indexed_lib is lib and handlers is lib.handlers
+
+    def _index_libs(self):
+        try:
+            while True:
+                with self._lock:
+                    if not self.pending_libs:
+                        break
+                    lib = self.pending_libs.pop(0)
+                self._index_lib(lib)
+                self.indexed_libs += 1
+                if self.on_update:
+                    self.on_update()
+        finally:
+            with self._lock:
+                self.indexed_libs = self.total_libs = 0
+                self._indexing = None
+        if self.on_update:
+            self.on_update()
+
+    def _index_lib(self, lib):
+        try:
+            _commands = library_commands(lib)
+        except Exception as exc:
+            # a library failing to list its keywords gets no completions
+            print_error("! failed to index library", f"{lib.name}: {exc}")
+            return
+        self._update_index(lib.name, self._add_commands(_commands))
+
+    def get_status(self):
+        """Get indexing progress, empty when done."""
+        if self.total_libs:
+            return f"indexing {self.indexed_libs}/{self.total_libs} libraries"
+        return ""
 
     def _get_custom_completions(self, cmd_name, document):
         completer = getattr(self.cmd_repl, "complete_{0}".format(cmd_name), None,)
@@ -64,22 +339,25 @@ class CmdCompleter(Completer):
             yield from _get_argument_completions(completer, document)
 
     def _get_command_completions(self, text):
-        return (
-            Completion(
-                name,
-                -len(text),
-                display=self.displays.get(name, ""),
-                display_meta=self.display_metas.get(name, ""),
-            )
-            for name in self.names
-            if (
-                (
-                    ("." not in name and "." not in text)  # root level
-                    or ("." in name and "." in text)
-                )  # library level
-                and name.lower().strip().startswith(text.strip())
-            )
-        )
+        for name in self._find_names(text):
+            entry = self.entries.get(name)
+            if entry is None:
+                yield Completion(name, -len(text))
+            else:
+                yield Completion(
+                    name,
+                    -len(text),
+                    display=entry.name,
+                    display_meta=get_display_meta(name, entry),
+                )
+
+    def _find_names(self, text):
+        """Prefix matches first, then best fuzzy matches not found by prefix."""
+        prefix = text.strip()
+        yield from self.index.find(text)
+        for name in self.fuzzy_index.find(text):
+            if not name.lower().strip().startswith(prefix):
+                yield name
 
     def get_completions(self, document, complete_event):
         """Compute suggestions."""
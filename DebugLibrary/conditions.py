@@ -0,0 +1,64 @@
+import io
+import token
+from functools import lru_cache
+from tokenize import generate_tokens, untokenize
+
+from robot.libraries.BuiltIn import BuiltIn
+from robot.variables import contains_variable
+from robot.variables.evaluation import EvaluationNamespace
+
+# distinct condition expressions kept compiled
+CONDITION_CACHE_SIZE = 1024
+
+
+def _decorate_variables(expression):
+    """Rewrite ``$name`` to the ``RF_VAR_name`` of robot's evaluation."""
+    tokens = []
+    variable_started = False
+    for toknum, tokval, _, _, _ in generate_tokens(io.StringIO(expression).readline):
+        if variable_started:
+            variable_started = False
+            if toknum == token.NAME:
+                tokens.append((token.NAME, "RF_VAR_" + tokval))
+                continue
+            tokens.append((token.ERRORTOKEN, "$"))
+        if toknum == token.ERRORTOKEN and tokval == "$":
+            variable_started = True
+        else:
+            tokens.append((toknum, tokval))
+    return untokenize(tokens).strip()
+
+
+@lru_cache(maxsize=CONDITION_CACHE_SIZE)
+def compile_condition(expression):
+    """Compile a condition expression once, ``$name`` variables included."""
+    if "$" in expression:
+        expression = _decorate_variables(expression)
+    return compile(expression.strip(), "<condition>", "eval")
+
+
+def is_true(condition):
+    """Evaluate a condition like ``Run Keyword If`` does, but faster.
+
+    The expression is compiled once per distinct string, and ``$name``
+    variables are looked up in the variable store at evaluation time.
+    ``${name}`` variables are replaced first, as robot does, so conditions
+    like ``$count > 3`` are compiled once while ``${count} > 3`` is
+    compiled on every evaluation.
+    """
+    robot = BuiltIn()
+    variables = robot._variables.current
+    resolved = contains_variable(condition)
+    if resolved:
+        condition = variables.replace_scalar(condition)
+        if not isinstance(condition, str):
+            return bool(condition)
+    try:
+        if resolved and "$" not in condition:
+            code = condition  # likely new for every value, not worth caching
+        else:
+            code = compile_condition(condition)
+        return bool(eval(code, {}, EvaluationNamespace(variables.store, {})))
+    except Exception:
+        # evaluate it again robot's way, failing with robot's error message
+        return robot._is_true(condition)
@@ -1,6 +1,7 @@
 import cmd
 import os
-from functools import cached_property
+import time
+from functools import cached_property, partial
 
 from prompt_toolkit import PromptSession
 from robot.api import logger
@@ -9,11 +10,14 @@ from robot.libraries.BuiltIn import BuiltIn
 from robot.errors import ExecutionFailed, HandlerExecutionFailed
 from robot.running.signalhandler import STOP_SIGNAL_MONITOR
 
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.history import FileHistory
 from prompt_toolkit.shortcuts import CompleteStyle, prompt
+from .breakpoints import BreakpointUsageError, get_breakpoints
 from .cmdcompleter import CmdCompleter
 from .globals import context
+from .history import AutoSuggestFromIndex, get_history
+from .keywordsearch import search_keywords
+from .keywordtimer import TimeitUsageError, parse_timeit_args, time_keyword
+from .profiler import SHOW_LIMIT, get_profile, start_profiling, stop_profiling
 from .robotkeyword import get_lib_keywords, find_keyword, run_keyword
 from .robotlib import get_libs, get_libs_dict, match_libs
 from .sourcelines import RobotNeedUpgrade, print_source_lines, print_test_case_lines
@@ -36,23 +40,32 @@ def reset_robotframework_exception():
         logger.info("Reset last exception of DebugLibrary")
 
 
-def run_robot_command(robot_instance, command):
-    """Run command in robotframewrk environment."""
-    if not command:
-        return
+def execute_robot_command(robot_instance, command):
+    """Run command in robotframework environment.
 
-    result = ""
+    Returns the result to show, and the kind and message of the error if
+    the command failed.
+    """
     try:
-        result = run_keyword(robot_instance, command)
+        return run_keyword(robot_instance, command), None
     except HandlerExecutionFailed as exc:
-        print_error("! keyword:", command)
-        print_error("! handler execution failed:", exc.full_message)
+        return None, ("handler execution failed", exc.full_message)
     except ExecutionFailed as exc:
-        print_error("! keyword:", command)
-        print_error("! execution failed:", str(exc))
+        return None, ("execution failed", str(exc))
     except Exception as exc:
+        return None, ("FAILED", repr(exc))
+
+
+def run_robot_command(robot_instance, command):
+    """Run command in robotframewrk environment."""
+    if not command:
+        return
+
+    result, error = execute_robot_command(robot_instance, command)
+    if error:
+        kind, message = error
         print_error("! keyword:", command)
-        print_error("! FAILED:", repr(exc))
+        print_error(f"! {kind}:", message)
 
     if result:
         head, message = result
@@ -88,7 +101,7 @@ def do_keywords(args) -> None:
         lib = libs[name]
         print_output("< Keywords of library", name)
         for keyword in get_lib_keywords(lib):
-            print_output(f"   {keyword['name']}\t", keyword["summary"])
+            print_output(f"   {keyword.name}\t", keyword.summary)
 
 
 def complete_libs(line):
@@ -110,9 +123,138 @@ def do_docs(keyword_name):
     if not keywords:
         print_error("< not find keyword", keyword_name)
     elif len(keywords) == 1:
-        logger.console(keywords[0]["doc"])
+        logger.console(keywords[0].doc)
     else:
-        print_error(f"< found {len(keywords)} keywords", ", ".join(keywords))
+        names = ", ".join(f"{keyword.lib}.{keyword.name}" for keyword in keywords)
+        print_error(f"< found {len(keywords)} keywords", names)
+
+
+def do_search(text):
+    if not text.strip():
+        print_error("< search for", "nothing")
+        return
+    keywords = search_keywords(text)
+    if not keywords:
+        print_error("< not find keyword matching", text)
+        return
+    print_output("< Keywords matching", text)
+    for keyword in keywords:
+        print_output(f"   {keyword.lib}.{keyword.name}\t", keyword.summary)
+
+
+def _format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    return f"{seconds * 1000:.3f} ms"
+
+
+def do_timeit(robot_instance, args):
+    try:
+        number, warmup, profile, command = parse_timeit_args(args)
+    except TimeitUsageError as exc:
+        print_error("< timeit:", str(exc))
+        return
+    result = time_keyword(robot_instance, command, number, warmup, profile)
+    print_output(
+        f"< {result.runs} runs, {warmup} warmup,", f"{result.failures} failed"
+    )
+    if result.failures:
+        print_error("! last error:", str(result.last_error))
+    if result.timings:
+        print_output(
+            "  ",
+            "  ".join(
+                f"{name} {_format_seconds(value)}"
+                for name, value in result.summary().items()
+            ),
+        )
+    if result.slowest_profile:
+        print_output("< Profile of the slowest run", "")
+        print(result.format_profile())
+
+
+def _print_profile(limit):
+    profiler = get_profile()
+    if profiler is None:
+        print_error("< profile:", "not started, use `profile start`")
+        return
+    print_output("< Hottest keywords", "self / total / calls")
+    for self_time, total, calls, name in profiler.hottest_keywords(limit):
+        print_output(
+            f"   {_format_seconds(self_time)} / {_format_seconds(total)} / {calls}",
+            f"\t{name}",
+        )
+    print_output("< Hottest call paths", "self / calls")
+    for self_time, calls, path in profiler.hottest_paths(limit):
+        print_output(
+            f"   {_format_seconds(self_time)} / {calls}", "\t" + " > ".join(path)
+        )
+
+
+def do_profile(args):
+    command, _, rest = args.strip().partition(" ")
+    rest = rest.strip()
+    if command == "start":
+        start_profiling()
+        print_output("< profile:", "started, keywords are timed after exit")
+    elif command == "stop":
+        stop_profiling()
+        print_output("< profile:", "stopped")
+    elif command == "reset":
+        profiler = get_profile()
+        if profiler is not None:
+            profiler.reset()
+        print_output("< profile:", "reset")
+    elif command in ("", "show"):
+        if rest and not rest.isdigit():
+            print_error("< profile show needs a number, got", rest)
+            return
+        _print_profile(int(rest) if rest else SHOW_LIMIT)
+    elif command == "export":
+        profiler = get_profile()
+        if profiler is None or not rest:
+            print_error("< profile export:", "needs a started profile and a path")
+            return
+        path = os.path.expanduser(rest)
+        try:
+            with open(path, "w", encoding="utf-8") as stacks:
+                for line in profiler.collapsed_stacks():
+                    stacks.write(line + "\n")
+        except OSError as exc:
+            print_error("< profile export failed:", str(exc))
+            return
+        print_output("< profile exported to", path)
+    else:
+        print_error("< profile: unknown command", command)
+
+
+def do_break(args):
+    breakpoints = get_breakpoints()
+    if not args.strip():
+        if not breakpoints:
+            print_output("< No breakpoints", "")
+        for point in breakpoints:
+            print_output("  ", str(point))
+        return
+    try:
+        point = breakpoints.add(args)
+    except BreakpointUsageError as exc:
+        print_error("< break:", str(exc))
+        return
+    print_output("< Breakpoint", str(point))
+
+
+def do_clear(args):
+    breakpoints = get_breakpoints()
+    if not args.strip():
+        breakpoints.clear()
+        print_output("< Deleted", "all breakpoints")
+        return
+    for number in args.split():
+        if not number.isdigit() or breakpoints.remove(int(number)) is None:
+            print_error("< No breakpoint", number)
+        else:
+            print_output("< Deleted breakpoint", number)
 
 
 def list_source(longlist=False):
@@ -152,6 +294,12 @@ def complete_selenium(line):
     return []
 
 
+def update_status(session):
+    """Show indexing progress of the completer in the bottom toolbar."""
+    session.bottom_toolbar = session.completer.get_status() or None
+    session.app.invalidate()
+
+
 class PromptToolkitCmd(cmd.Cmd):
     """CMD shell using prompt-toolkit."""
 
@@ -167,7 +315,9 @@ Type "help" for more information.\
         # Defaults are tab completion with stdin None stdout None
         super().__init__()
         self.robot = BuiltIn()
-        self.history = FileHistory(os.path.expanduser(HISTORY_PATH))
+        self.history = get_history(HISTORY_PATH)
+        self.started = None
+        self.time_to_first_prompt = None
 
     def help_help(self):
         """Help of Help command"""
@@ -203,28 +353,41 @@ Type "help" for more information.\
 
     @cached_property
     def session(self):
+        completer = self.get_completer()
         session = PromptSession(
             history=self.history,
-            auto_suggest=AutoSuggestFromHistory(),
+            auto_suggest=AutoSuggestFromIndex(self.history.history.index),
             enable_history_search=True,
-            completer=self.get_completer(),
+            completer=completer,
             complete_style=CompleteStyle.MULTI_COLUMN,
             style=self.prompt_style,
-            message=get_debug_prompt_tokens(self.prompt)
+            message=get_debug_prompt_tokens(self.prompt),
         )
+        completer.on_update = partial(update_status, session)
+        update_status(session)
         return session
 
     def get_input(self):
+        session = self.session
+        if self.time_to_first_prompt is None:
+            self.time_to_first_prompt = time.perf_counter() - self.started
+            logger.debug(f"Time to first prompt: {self.time_to_first_prompt:.3f}s")
         try:
-            line = self.session.prompt()
+            line = session.prompt()
         except EOFError:
             line = "EOF"
         return line
 
     def postcmd(self, stop, line):
         """Run after a command."""
+        self.update_completer()
         return stop
 
+    def update_completer(self):
+        """Index libraries imported or reloaded since the last update."""
+        if "session" in self.__dict__:
+            self.session.completer.update_libs()
+
     def pre_loop_iter(self):
         """Reset robotframework before every loop iteration."""
         reset_robotframework_exception()
@@ -302,6 +465,50 @@ Access https://github.com/xyb/robotframework-debuglibrary for more details.\
         """
         return do_docs(keyword_name)
 
+    def do_search(self, text):
+        """Search keywords of imported libraries by name, doc and arguments.
+
+         search <words>
+        """
+        return do_search(text)
+
+    def do_timeit(self, args):
+        """Run a keyword repeatedly and show statistics of its run times.
+
+         timeit [-n <runs>] [-w <warmup runs>] [-p]  <keyword line>
+
+        Runs 10 times after 1 warmup run by default, -p profiles every run
+        and prints the profile of the slowest one.
+        """
+        return do_timeit(self.robot, args)
+
+    def do_profile(self, args):
+        """Profile keywords run by robot, to find the slowest ones.
+
+         profile start|stop|reset|show [<count>]|export <path>
+
+        Started profiles time keywords after the shell exits, the shell's
+        own time excluded. Export writes collapsed stacks for flamegraphs.
+        """
+        return do_profile(args)
+
+    def do_break(self, args):
+        """Set a breakpoint, or list breakpoints without arguments.
+
+         break <keyword name>|<file>:<line>[  if  <condition>]
+
+        Execution continued by `continue` stops before the keyword, or the
+        keyword at the line, when the condition is true if given.
+        """
+        return do_break(args)
+
+    def do_clear(self, args):
+        """Delete the breakpoints of the numbers given, or all of them.
+
+         clear [<number> ...]
+        """
+        return do_clear(args)
+
     def emptyline(self):
         """Repeat last nonempty command if in step mode."""
         self.repeat_last_nonempty_command = context.in_step_mode
@@ -316,17 +523,45 @@ Access https://github.com/xyb/robotframework-debuglibrary for more details.\
         """Append exit command to queue."""
         self.append_command("exit")
 
-    def do_step(self, args):
-        """Execute the current line, stop at the first possible occasion."""
+    def step_to(self, depth=None, until=None):
+        """Leave the shell, stop again at a keyword at most depth deep."""
         context.in_step_mode = True
+        context.step_depth = depth
+        context.step_until = until
         self.append_exit()  # pass control back to robot runner
 
+    def do_step(self, args):
+        """Execute the current line, stop at the first possible occasion."""
+        self.step_to()
+
     def do_next(self, args):
         """Continue execution until the next line is reached or it returns."""
-        self.do_step(args)
+        self.step_to(context.current_depth)
+
+    def do_finish(self, args):
+        """Continue execution until the current user keyword returns."""
+        self.step_to(context.current_depth - 1)
+
+    def do_until(self, args):
+        """Continue execution until a line after the given one is reached.
+
+         until [<line>]
+
+        Without a line, continue until a line after the current one, e.g. to
+        leave a loop. Stops as well when the current user keyword returns.
+        """
+        if not context.current_source_path:
+            print("Please run `step` or `next` command first.")
+            return
+        args = args.strip()
+        if args and not args.isdigit():
+            print_error("< until needs a line number, got", args)
+            return
+        lineno = int(args) if args else context.current_source_lineno + 1
+        self.step_to(context.current_depth, (context.current_source_path, lineno))
 
     def do_continue(self, args):
-        """Continue execution."""
+        """Continue execution, until a breakpoint is hit if any set."""
         self.do_exit(args)
 
     def list_source(self, longlist=False):
@@ -346,6 +581,7 @@ Access https://github.com/xyb/robotframework-debuglibrary for more details.\
     def do_exit(self, args):
         """Exit the interpreter. You can also use the Ctrl-D shortcut."""
         context.in_step_mode = False  # explicitly exit REPL will disable step mode
+        context.step_depth = context.step_until = None
         self.append_exit()
         return True
 
@@ -379,10 +615,10 @@ Access https://github.com/xyb/robotframework-debuglibrary for more details.\
 
         override default cmdloop method
         """
-        if intro is not None:
-            self.intro = intro
-        if self.intro:
-            self.stdout.write(self.intro)
+        if intro is None:
+            intro = self.intro
+        if intro:
+            self.stdout.write(intro)
             self.stdout.write("\n")
 
         self.preloop()
@@ -393,6 +629,17 @@ Access https://github.com/xyb/robotframework-debuglibrary for more details.\
 
         self.postloop()
 
+    def preloop(self):
+        """Prepare a shell reused across Debug keyword calls."""
+        self.started = time.perf_counter()
+        self.time_to_first_prompt = None
+        self.cmdqueue = []
+        self.update_completer()
+
+    def postloop(self):
+        # drop the exit command, so an outer shell of nested Debug goes on
+        self.cmdqueue = []
+
     def do_pdb(self, arg):
         """Enter the python debugger pdb. For development only."""
         do_pdb()
@@ -401,6 +648,7 @@ Access https://github.com/xyb/robotframework-debuglibrary for more details.\
     do_ll = do_longlist
     do_l = do_list
     do_c = do_continue
+    do_b = do_break
     do_n = do_next
     do_s = do_step
     do_d = do_docs
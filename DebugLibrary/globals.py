@@ -1,10 +1,18 @@
 class SingletonContext:
     in_step_mode = False
+    # keyword depth of the last stop, and where step mode stops next
+    current_depth = 0
+    step_depth = None
+    step_until = None
     current_runner = None
     current_runner_step = None
     current_source_path = ""
     current_source_lineno = 0
     last_command = ""
+    server_path = None
+    batch_path = None
+    profiler = None
+    breakpoints = None
 
     def __new__(cls):
         if not hasattr(cls, "instance"):
@@ -0,0 +1,222 @@
+import os
+import tempfile
+import threading
+from bisect import bisect_left, insort
+
+from prompt_toolkit.auto_suggest import AutoSuggest, Suggestion
+from prompt_toolkit.history import FileHistory, ThreadedHistory
+
+# maximum number of distinct commands kept in the history file
+HISTORY_SIZE = int(os.environ.get("RFDEBUG_HISTORY_SIZE", 10000))
+
+BLOCK_SIZE = 64 * 1024
+
+# every earlier use of a command ranks it like this many commands more recent
+FREQUENCY_WEIGHT = 50
+
+_histories = {}
+
+
+def read_lines_backwards(path, block_size=BLOCK_SIZE, end=None):
+    """Yield lines of a file as bytes, last line first.
+
+    Reads from the end of the file, or from the given offset.
+    """
+    with open(path, "rb") as history_file:
+        position = history_file.seek(0, os.SEEK_END)
+        if end is not None:
+            position = min(end, position)
+        remainder = b""
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            history_file.seek(position)
+            lines = (history_file.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            yield from reversed(lines)
+        yield remainder
+
+
+def read_entries_backwards(path, end=None):
+    """Yield history entries of a FileHistory format file, newest first."""
+    lines = []
+    for line in read_lines_backwards(path, end=end):
+        if line.startswith(b"+"):
+            lines.append(line[1:].decode("utf-8", errors="replace"))
+        elif lines:
+            yield "\n".join(reversed(lines))
+            lines = []
+    if lines:
+        yield "\n".join(reversed(lines))
+
+
+class HistoryIndex:
+    """History lines sorted for prefix lookups, ranked by recency and use.
+
+    Lines are added as the history loads, oldest last, and as commands
+    run. The best line of every looked up prefix is cached until a line
+    with that prefix changes, so a keystroke usually costs a dict lookup.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.ranks = {}
+        self._sorted = True
+        self._best = {}
+        self._older = 0
+        self._newer = 0
+        self._lock = threading.Lock()
+
+    def add_older(self, entry):
+        """Add an entry older than all added so far, while loading."""
+        with self._lock:
+            self._older -= 1
+            for line in entry.splitlines():
+                if line in self.ranks:
+                    last_used, uses = self.ranks[line]
+                    self.ranks[line] = (last_used, uses + 1)
+                else:
+                    self.lines.append(line)
+                    self._sorted = False
+                    self.ranks[line] = (self._older, 1)
+            self._best.clear()
+
+    def add(self, entry):
+        """Add an entry run just now."""
+        with self._lock:
+            self._newer += 1
+            for line in entry.splitlines():
+                _, uses = self.ranks.get(line, (0, 0))
+                if not uses:
+                    if self._sorted:
+                        insort(self.lines, line)
+                    else:
+                        self.lines.append(line)
+                self.ranks[line] = (self._newer, uses + 1)
+                for end in range(len(line) + 1):
+                    self._best.pop(line[:end], None)
+
+    def _rank(self, line):
+        last_used, uses = self.ranks[line]
+        return last_used + FREQUENCY_WEIGHT * (uses - 1)
+
+    def find(self, prefix):
+        """Get the best line starting with prefix and longer than it."""
+        with self._lock:
+            if prefix in self._best:
+                return self._best[prefix]
+            if not self._sorted:
+                self.lines.sort()
+                self._sorted = True
+            best = None
+            index = bisect_left(self.lines, prefix)
+            while index < len(self.lines) and self.lines[index].startswith(prefix):
+                line = self.lines[index]
+                if line != prefix and (
+                    best is None or self._rank(line) > self._rank(best)
+                ):
+                    best = line
+                index += 1
+            self._best[prefix] = best
+            return best
+
+
+class AutoSuggestFromIndex(AutoSuggest):
+    """Suggest the best history line starting with the input."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def get_suggestion(self, buffer, document):
+        # consider only the last line, like AutoSuggestFromHistory
+        text = document.text.rsplit("\n", 1)[-1]
+        if not text.strip():
+            return None
+        line = self.index.find(text)
+        if line is None:
+            return None
+        return Suggestion(line[len(text):])
+
+
+class BoundedFileHistory(FileHistory):
+    """File history loaded newest first, without duplicates, up to a size.
+
+    Only the end of the file is read, as far as needed for ``max_size``
+    distinct entries. A file holding more entries than that, or many
+    duplicates, is compacted to them. The file format is FileHistory's.
+
+    Loading runs in a background thread. Compacting keeps whatever was
+    appended to the file since loading started, by this shell or another
+    process, and commands are not stored while the file is replaced.
+    """
+
+    def __init__(self, filename, max_size=HISTORY_SIZE):
+        super().__init__(filename)
+        self.max_size = max_size
+        self.index = HistoryIndex()
+        self._loaded_size = 0
+        self._file_lock = threading.Lock()
+
+    def load_history_strings(self):
+        if not os.path.exists(self.filename):
+            return
+        seen = set()
+        kept = []
+        duplicates = 0
+        # entries appended later are not loaded, but kept by compacting
+        self._loaded_size = os.path.getsize(self.filename)
+        entries = read_entries_backwards(self.filename, end=self._loaded_size)
+        for entry in entries:
+            if entry in seen:
+                duplicates += 1
+                self.index.add_older(entry)  # counts another use
+                continue
+            if len(kept) >= self.max_size:
+                # only older entries left, drop them from the file
+                entries.close()
+                self._compact(kept)
+                return
+            seen.add(entry)
+            kept.append(entry)
+            self.index.add_older(entry)
+            yield entry
+        if duplicates > self.max_size:
+            self._compact(kept)
+
+    def store_string(self, string):
+        self.index.add(string)
+        with self._file_lock:
+            super().store_string(string)
+
+    def _compact(self, entries):
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        with self._file_lock:
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as history_file:
+                        for entry in reversed(entries):
+                            history_file.write(b"\n# compacted\n")
+                            for line in entry.split("\n"):
+                                history_file.write(f"+{line}\n".encode("utf-8"))
+                        # entries appended since loading started
+                        with open(self.filename, "rb") as old_file:
+                            old_file.seek(self._loaded_size)
+                            history_file.write(old_file.read())
+                    os.replace(tmp_path, self.filename)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError:
+                pass  # compacted again next time
+
+
+def get_history(path):
+    """Get the history of a file, shared by all shells of the process.
+
+    Entries are loaded in a background thread as the prompt needs them.
+    """
+    path = os.path.expanduser(path)
+    if path not in _histories:
+        _histories[path] = ThreadedHistory(BoundedFileHistory(path))
+    return _histories[path]
@@ -2,21 +2,38 @@ import sys
 
 from robot.libraries.BuiltIn import run_keyword_variant
 
-from .debugcmd import DebugCmd
 from .globals import context
-from .robotkeyword import run_debug_if
+from .robotlib import get_keyword_depth
 from .steplistener import RobotLibraryStepListener
-from .styles import print_output
 
 
 class DebugKeywords(RobotLibraryStepListener):
     """Debug Keywords for RobotFramework."""
 
+    debug_cmd = None
+
     def debug(self):
         """Open a interactive shell, run any RobotFramework keywords.
 
         Keywords separated by two space or one tab, and Ctrl-D to exit.
         """
+        if context.batch_path:
+            return self._run_batch(context.batch_path)
+
+        # the shell and prompt_toolkit are only imported once a debug
+        # feature is used, not in every run which imports the library
+        from .debugcmd import DebugCmd
+        from .styles import print_output
+
+        # keywords run in the shell do not hit breakpoints or step
+        self.step_listener.detach()
+        context.current_depth = get_keyword_depth()
+
+        # time in the shell is not spent by keywords
+        profiler = context.profiler
+        if profiler is not None:
+            profiler.pause()
+
         # re-wire stdout so that we can use the cmd module and have readline
         # support
         old_stdout = sys.stdout
@@ -26,8 +43,14 @@ class DebugKeywords(RobotLibraryStepListener):
         if show_intro:
             print_output("\n>>>>>", "Enter interactive shell")
 
-        self.debug_cmd = DebugCmd()
-        if show_intro:
+        # the shell is reused by later calls, e.g. every keyword in step mode
+        if self.debug_cmd is None:
+            self.debug_cmd = DebugCmd()
+        if context.server_path:
+            from .server import serve
+
+            serve(self.debug_cmd, context.server_path)
+        elif show_intro:
             self.debug_cmd.cmdloop()
         else:
             self.debug_cmd.cmdloop(intro="")
@@ -39,7 +62,28 @@ class DebugKeywords(RobotLibraryStepListener):
         # put stdout back where it was
         sys.stdout = old_stdout
 
-    @run_keyword_variant(resolve=1)
+        if profiler is not None:
+            profiler.resume()
+
+        self._update_step_listener()
+
+    def _run_batch(self, path):
+        from .batch import run_batch
+
+        try:
+            executed, failed = run_batch(path)
+        except OSError as exc:
+            # robot's own message is not shown with --console none
+            sys.__stderr__.write(f"cannot run batch: {exc}\n")
+            raise
+        sys.__stderr__.write(f"{executed} lines executed, {failed} failed\n")
+        if failed:
+            raise AssertionError(f"{failed} of {executed} batch lines failed")
+
+    # the condition is left unresolved to be compiled once, see run_debug_if
+    @run_keyword_variant(resolve=0)
     def debug_if(self, condition, *args):
         """Runs the Debug keyword if condition is true."""
+        from .robotkeyword import run_debug_if
+
         return run_debug_if(condition, *args)
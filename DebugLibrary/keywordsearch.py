@@ -0,0 +1,174 @@
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+
+from .robotkeyword import get_lib_keywords
+from .robotlib import get_libs
+
+# maximum number of search results
+SEARCH_LIMIT = 20
+# shorter query terms only match whole words, not word prefixes
+MIN_PREFIX_LENGTH = 3
+
+_WORD = re.compile(r"[^\W_]+")
+_ARG_NAME = re.compile(r"[\w*]+")
+
+# name matches rank above argument name matches, above doc matches
+FIELD_WEIGHTS = {"name": 3.0, "args": 2.0, "doc": 1.0}
+
+
+def tokenize(text):
+    """Lowercase words of text, underscores separate words too."""
+    return _WORD.findall(text.lower())
+
+
+def _arg_words(args):
+    for arg in args:
+        # "name: int = 1", "*args" and "separator=None" all start with a name
+        match = _ARG_NAME.match(arg)
+        if match:
+            yield from tokenize(match.group())
+
+
+class SearchIndex:
+    """Inverted index over keyword names, docs and argument names.
+
+    Postings are compact arrays of keyword ids per word and field.
+    Libraries are added as they are imported, a reloaded library's old
+    keywords are marked removed, and the index is rebuilt once removed
+    keywords are as many as live ones.
+    """
+
+    def __init__(self):
+        self.libraries = {}
+        self._clear()
+
+    def _clear(self):
+        self.keywords = []
+        self.postings = {field: {} for field in FIELD_WEIGHTS}
+        self.removed = 0
+        self._words = None
+
+    @property
+    def live(self):
+        """Number of keywords not removed."""
+        return len(self.keywords) - self.removed
+
+    def add_library(self, library, keywords):
+        """Index keywords of a library, replacing those indexed before."""
+        old = self.libraries.get(library.name)
+        if old is not None:
+            indexed_library, handlers, _, ids = old
+            # reloading a library replaces its handlers
+            if indexed_library is library and handlers is library.handlers:
+                return
+            for keyword_id in ids:
+                self.keywords[keyword_id] = None
+            self.removed += len(ids)
+        self.libraries[library.name] = (
+            library,
+            library.handlers,
+            keywords,
+            self._add_keywords(keywords),
+        )
+        if self.removed > self.live:
+            self._compact()
+
+    def _add_keywords(self, keywords):
+        start = len(self.keywords)
+        for keyword in keywords:
+            keyword_id = len(self.keywords)
+            self.keywords.append(keyword)
+            self._add(keyword_id, "name", tokenize(keyword.name))
+            self._add(keyword_id, "args", _arg_words(keyword.args))
+            self._add(keyword_id, "doc", tokenize(keyword.doc))
+        return range(start, len(self.keywords))
+
+    def _compact(self):
+        """Index live keywords again, dropping removed ones."""
+        self._clear()
+        for name, (library, handlers, keywords, _) in self.libraries.items():
+            ids = self._add_keywords(keywords)
+            self.libraries[name] = (library, handlers, keywords, ids)
+
+    def _add(self, keyword_id, field, words):
+        postings = self.postings[field]
+        for word in set(words):
+            if word not in postings:
+                postings[word] = array("I")
+                self._words = None
+            postings[word].append(keyword_id)
+
+    @property
+    def words(self):
+        """All indexed words, sorted for prefix lookups."""
+        if self._words is None:
+            self._words = sorted(set().union(*self.postings.values()))
+        return self._words
+
+    def _expand(self, term):
+        if len(term) < MIN_PREFIX_LENGTH:
+            return [term]
+        words = self.words
+        index = bisect_left(words, term)
+        matched = []
+        while index < len(words) and words[index].startswith(term):
+            matched.append(words[index])
+            index += 1
+        return matched
+
+    def _score_term(self, term):
+        total = self.live
+        scores = {}
+        for word in self._expand(term):
+            for field, weight in FIELD_WEIGHTS.items():
+                ids = self.postings[field].get(word)
+                if not ids:
+                    continue
+                # rare words weigh more, prefix matches a bit less than words
+                score = weight * math.log(1 + total / len(ids))
+                if word != term:
+                    score *= 0.8
+                for keyword_id in ids:
+                    if score > scores.get(keyword_id, 0):
+                        scores[keyword_id] = score
+        return scores
+
+    def search(self, text, limit=SEARCH_LIMIT):
+        """Get keywords matching every term of text, best first."""
+        scores = None
+        for term in dict.fromkeys(tokenize(text)):
+            term_scores = self._score_term(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    keyword_id: score + term_scores[keyword_id]
+                    for keyword_id, score in scores.items()
+                    if keyword_id in term_scores
+                }
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        best = heapq.nsmallest(
+            limit,
+            (
+                (-score, self.keywords[keyword_id].name, keyword_id)
+                for keyword_id, score in scores.items()
+                if self.keywords[keyword_id] is not None
+            ),
+        )
+        return [self.keywords[keyword_id] for _, _, keyword_id in best]
+
+
+_search_index = SearchIndex()
+
+
+def search_keywords(text, limit=SEARCH_LIMIT):
+    """Search keywords of all imported libraries by words."""
+    for lib in get_libs():
+        _search_index.add_library(lib, get_lib_keywords(lib))
+    return _search_index.search(text, limit)
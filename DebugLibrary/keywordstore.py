@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import tempfile
+
+CACHE_PATH = os.environ.get("RFDEBUG_CACHE", "~/.cache/rfdebug")
+
+# bump when the stored keyword format changes
+STORE_VERSION = 4
+
+
+def get_store_key(library):
+    """Get key identifying a library's keywords, None if not storable.
+
+    Keyword names are part of the key, as dynamic libraries may change
+    their keywords without their source changing.
+    """
+    source = library.source
+    if not source or not os.path.isfile(source):
+        return None
+    return [
+        STORE_VERSION,
+        library.name,
+        library.version,
+        source,
+        os.stat(source).st_mtime_ns,
+        repr(library.positional_args),
+        repr(library.named_args),
+        _get_names_digest(library),
+    ]
+
+
+def _get_names_digest(library):
+    names = "\n".join(handler.name for handler in library.handlers)
+    return hashlib.sha1(names.encode("utf-8")).hexdigest()
+
+
+def _get_store_path(library):
+    # one file per library import, a new version or edit overwrites it,
+    # the key in the file tells whether it is up to date
+    name = [
+        library.name,
+        library.source,
+        repr(library.positional_args),
+        repr(library.named_args),
+    ]
+    digest = hashlib.sha1(json.dumps(name).encode("utf-8")).hexdigest()
+    return os.path.join(os.path.expanduser(CACHE_PATH), f"{digest}.json")
+
+
+def load_keywords(library):
+    """Load stored keywords of a library, None if not stored or outdated."""
+    key = get_store_key(library)
+    if key is None:
+        return None
+    try:
+        with open(_get_store_path(library), encoding="utf-8") as store:
+            stored = json.load(store)
+    except (OSError, ValueError):
+        return None
+    if stored.get("key") != key:
+        return None
+    return stored["keywords"]
+
+
+def save_keywords(library, keywords):
+    """Store keywords of a library for later sessions.
+
+    The file is written under a temporary name and renamed into place, so
+    robot processes sharing the store never see a partial file.
+    """
+    key = get_store_key(library)
+    if key is None:
+        return
+    path = _get_store_path(library)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as store:
+                json.dump({"key": key, "keywords": keywords}, store)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # a read-only home only loses the speed up
@@ -0,0 +1,122 @@
+import cProfile
+import io
+import math
+import pstats
+import statistics
+import time
+
+from robot.running.signalhandler import STOP_SIGNAL_MONITOR
+
+from .robotkeyword import run_keyword
+
+DEFAULT_NUMBER = 10
+DEFAULT_WARMUP = 1
+# functions listed from the profile of the slowest run
+PROFILE_LIMIT = 15
+
+
+class TimeitUsageError(ValueError):
+    pass
+
+
+def parse_timeit_args(args):
+    """Split ``[-n N] [-w warmup] [-p]  <keyword line>`` into its parts."""
+    number, warmup, profile = DEFAULT_NUMBER, DEFAULT_WARMUP, False
+    rest = args.strip()
+    while rest.startswith("-"):
+        option, _, rest = rest.partition(" ")
+        rest = rest.lstrip()
+        if option == "-p":
+            profile = True
+            continue
+        if option not in ("-n", "-w"):
+            raise TimeitUsageError(f"unknown option {option}")
+        value, _, rest = rest.partition(" ")
+        rest = rest.lstrip()
+        try:
+            value = int(value)
+        except ValueError:
+            raise TimeitUsageError(f"{option} needs a number, got {value!r}")
+        if value < 0 or (option == "-n" and value < 1):
+            raise TimeitUsageError(f"{option} out of range: {value}")
+        if option == "-n":
+            number = value
+        else:
+            warmup = value
+    if not rest:
+        raise TimeitUsageError("no keyword to time")
+    return number, warmup, profile, rest
+
+
+def percentile(sorted_values, percent):
+    """Nearest rank percentile of sorted values."""
+    rank = math.ceil(len(sorted_values) * percent / 100)
+    return sorted_values[max(rank, 1) - 1]
+
+
+class KeywordTimings:
+    """Timings in seconds of successful runs of a keyword, and failures."""
+
+    def __init__(self, command):
+        self.command = command
+        self.timings = []
+        self.failures = 0
+        self.last_error = None
+        self.slowest_profile = None
+
+    @property
+    def runs(self):
+        return len(self.timings) + self.failures
+
+    def summary(self):
+        """Get min, median, p95, max and standard deviation."""
+        timings = sorted(self.timings)
+        return {
+            "min": timings[0],
+            "median": statistics.median(timings),
+            "p95": percentile(timings, 95),
+            "max": timings[-1],
+            "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        }
+
+    def format_profile(self, limit=PROFILE_LIMIT):
+        output = io.StringIO()
+        stats = pstats.Stats(self.slowest_profile, stream=output)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return output.getvalue()
+
+
+def time_keyword(robot_instance, command, number, warmup=0, profile=False):
+    """Run a keyword line repeatedly and time every run.
+
+    Warmup runs are not timed. With profile, every run is profiled and
+    the profile of the slowest successful run kept, which slows the runs.
+    """
+    for _ in range(warmup):
+        try:
+            run_keyword(robot_instance, command)
+        except Exception:
+            pass
+
+    result = KeywordTimings(command)
+    slowest = -1
+    for _ in range(number):
+        if STOP_SIGNAL_MONITOR._signal_count:
+            break  # Ctrl-C
+        profiler = cProfile.Profile() if profile else None
+        started = time.perf_counter()
+        try:
+            if profiler:
+                profiler.runcall(run_keyword, robot_instance, command)
+            else:
+                run_keyword(robot_instance, command)
+        except Exception as exc:
+            result.failures += 1
+            result.last_error = exc
+            continue
+        elapsed = time.perf_counter() - started
+        result.timings.append(elapsed)
+        if profiler and elapsed > slowest:
+            slowest = elapsed
+            result.slowest_profile = profiler
+    return result
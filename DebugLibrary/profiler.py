@@ -0,0 +1,164 @@
+import heapq
+import time
+
+from .globals import context
+
+# call tree nodes kept, deeper new call paths are merged into "(other)"
+MAX_NODES = 10000
+OTHER = "(other)"
+# keywords and call paths listed by `profile show`
+SHOW_LIMIT = 10
+
+# control structures are profiled by type, their names change per run
+_KEYWORD_TYPES = {"KEYWORD", "SETUP", "TEARDOWN"}
+
+
+class CallNode:
+    """Keyword calls aggregated by call path."""
+
+    __slots__ = ("name", "calls", "total", "self_time", "children")
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.children = {}
+
+
+def profile_name(name, attrs):
+    """Name of a keyword event in the call tree."""
+    keyword_type = attrs.get("type", "KEYWORD").upper()
+    if keyword_type in _KEYWORD_TYPES:
+        return name
+    return keyword_type
+
+
+class KeywordProfiler:
+    """Aggregated call tree of keywords with self and total time.
+
+    Fed with start and end keyword events. Time spent in the debug shell
+    is excluded by pausing the profiler while the shell is open.
+    """
+
+    def __init__(self, max_nodes=MAX_NODES, clock=time.perf_counter):
+        self.max_nodes = max_nodes
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.root = CallNode("")
+        self.nodes = 0
+        # [node, start time, time spent in children] of open keywords
+        self.stack = []
+        self.paused_at = None
+
+    def _child(self, parent, name):
+        node = parent.children.get(name)
+        if node is None:
+            if self.nodes >= self.max_nodes:
+                name = OTHER
+                node = parent.children.get(name)
+            if node is None:
+                node = parent.children[name] = CallNode(name)
+                self.nodes += 1
+        return node
+
+    def start_keyword(self, name):
+        if self.paused_at is not None:
+            return
+        parent = self.stack[-1][0] if self.stack else self.root
+        self.stack.append([self._child(parent, name), self.clock(), 0.0])
+
+    def end_keyword(self):
+        if self.paused_at is not None or not self.stack:
+            return  # started before profiling or while paused
+        node, started, children_time = self.stack.pop()
+        elapsed = self.clock() - started
+        node.calls += 1
+        node.total += elapsed
+        node.self_time += elapsed - children_time
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = self.clock()
+
+    def resume(self):
+        if self.paused_at is None:
+            return
+        paused = self.clock() - self.paused_at
+        for frame in self.stack:
+            frame[1] += paused
+        self.paused_at = None
+
+    def walk(self, node=None, path=()):
+        """Yield call paths with their nodes, depth first."""
+        for child in (node or self.root).children.values():
+            child_path = path + (child.name,)
+            yield child_path, child
+            yield from self.walk(child, child_path)
+
+    def hottest_keywords(self, limit):
+        """Get (self time, total time, calls, name) of slowest keywords."""
+        keywords = {}
+        for _, node in self.walk():
+            if not node.calls:
+                continue  # still running
+            self_time, total, calls = keywords.get(node.name, (0.0, 0.0, 0))
+            keywords[node.name] = (
+                self_time + node.self_time,
+                total + node.total,
+                calls + node.calls,
+            )
+        return heapq.nlargest(
+            limit,
+            (
+                (self_time, total, calls, name)
+                for name, (self_time, total, calls) in keywords.items()
+            ),
+        )
+
+    def hottest_paths(self, limit):
+        """Get (self time, calls, path) of call paths with most self time."""
+        return heapq.nlargest(
+            limit,
+            (
+                (node.self_time, node.calls, path)
+                for path, node in self.walk()
+                if node.calls
+            ),
+            key=lambda item: item[0],
+        )
+
+    def collapsed_stacks(self):
+        """Yield call paths in the collapsed stack format of flamegraphs.
+
+        Values are self time in microseconds.
+        """
+        for path, node in self.walk():
+            micros = int(node.self_time * 1000000)
+            if micros > 0:
+                yield ";".join(name.replace(";", ",") for name in path) + f" {micros}"
+
+
+# the profile shown after profiling stopped
+_last_profiler = None
+
+
+def start_profiling():
+    """Profile keywords from now on, keeps an already running profile."""
+    global _last_profiler
+    if context.profiler is None:
+        context.profiler = _last_profiler = KeywordProfiler()
+    return context.profiler
+
+
+def stop_profiling():
+    context.profiler = None
+
+
+def get_profile():
+    """Get the running profile, or the last one after it stopped."""
+    return context.profiler or _last_profiler
@@ -1,9 +1,13 @@
+import os
 import re
+import threading
+from collections import OrderedDict
 
 from robot.libraries.BuiltIn import BuiltIn
-from robot.libdocpkg.robotbuilder import KeywordDocBuilder, LibraryDocBuilder
-from robot.libdocpkg.model import LibraryDoc
+from robot.utils import normalize
 
+from .conditions import is_true
+from .keywordstore import load_keywords, save_keywords
 from .robotlib import get_libs
 
 try:
@@ -13,7 +17,8 @@ except ImportError:
 
 KEYWORD_SEP = re.compile("  +|\t")
 
-_lib_keywords_cache = {}
+# maximum number of libraries to keep keywords of, unbounded by default
+KEYWORD_CACHE_SIZE = int(os.environ.get("RFDEBUG_KEYWORD_CACHE_SIZE", 0)) or None
 
 
 def assign_variable(robot_instance, variable_name, args):
@@ -23,41 +28,176 @@ def assign_variable(robot_instance, variable_name, args):
     return variable_value
 
 
+def normalize_name(name):
+    """Normalize keyword or library name, ignoring case, spaces and underscores."""
+    return normalize(name, ignore="_")
+
+
 def parse_keyword(command):
     """Split a robotframework keyword string."""
     # TODO use robotframework functions
     return KEYWORD_SEP.split(command)
 
 
-class ImportedLibraryDocBuilder(LibraryDocBuilder):
-    def build(self, lib):
-        libdoc = LibraryDoc(
-            name=lib.name, doc=self._get_doc(lib), doc_format=lib.doc_format,
+class LibraryDocs:
+    """Documentation and arguments of a library's keywords.
+
+    Built with libdoc the first time any keyword needs them, written into
+    the keywords, then stored on disk for later sessions.
+    """
+
+    def __init__(self, library):
+        self.library = library
+        self.keywords = []
+
+    def resolve(self):
+        from robot.libdocpkg.robotbuilder import KeywordDocBuilder
+
+        docs = {
+            keyword.name: keyword
+            for keyword in KeywordDocBuilder().build_keywords(self.library)
+        }
+        for keyword in self.keywords:
+            doc = docs[keyword.name]
+            keyword.resolve(doc.doc, [str(arg) for arg in doc.args])
+        save_keywords(self.library, [keyword.to_dict() for keyword in self.keywords])
+
+
+class LibraryKeyword:
+    """Keyword of an imported library.
+
+    Only the name and the documentation are kept, which is the raw handler
+    documentation until the full documentation and arguments are resolved
+    on first access. Many thousands of these are alive in a shell.
+    """
+
+    __slots__ = ("name", "lib", "_doc", "_args", "_docs")
+
+    def __init__(self, name, lib, doc, args=None, docs=None):
+        self.name = name
+        self.lib = lib
+        self._doc = doc
+        self._args = args
+        self._docs = docs
+
+    def resolve(self, doc, args):
+        self._doc = doc
+        self._args = args
+        self._docs = None
+
+    @property
+    def summary(self):
+        return self._doc.split("\n", 1)[0]
+
+    @property
+    def doc(self):
+        if self._docs is not None:
+            self._docs.resolve()
+        return self._doc
+
+    @property
+    def args(self):
+        if self._docs is not None:
+            self._docs.resolve()
+        return self._args
+
+    def to_dict(self):
+        return {"name": self.name, "doc": self.doc, "args": self.args}
+
+
+class KeywordCache:
+    """Keywords of imported libraries, with a normalized name index each.
+
+    Entries belong to a library instance, and are dropped when the library
+    is re-imported, reloaded or changes version or source. With a
+    ``max_size`` the least recently used libraries are evicted.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _identity(library):
+        return library, library.handlers, library.version, library.source
+
+    def _is_valid(self, identity, library):
+        cached_library, handlers, version, source = identity
+        # reloading a library replaces its handlers
+        return (
+            cached_library is library
+            and handlers is library.handlers
+            and (version, source) == (library.version, library.source)
         )
-        libdoc.inits = self._get_initializers(lib)
-        libdoc.keywords = KeywordDocBuilder().build_keywords(lib)
-        return libdoc
+
+    def _get_entry(self, library):
+        with self._lock:
+            entry = self._entries.get(library.name)
+            if entry is None:
+                return None
+            if not self._is_valid(entry[0], library):
+                del self._entries[library.name]
+                return None
+            self._entries.move_to_end(library.name)
+            return entry
+
+    def get(self, library):
+        entry = self._get_entry(library)
+        return None if entry is None else entry[1]
+
+    def get_names(self, library):
+        """Get keywords of a library by normalized name."""
+        entry = self._get_entry(library)
+        return None if entry is None else entry[2]
+
+    def add(self, library, keywords):
+        names = {}
+        for keyword in keywords:
+            names.setdefault(normalize_name(keyword.name), []).append(keyword)
+        with self._lock:
+            self._entries.pop(library.name, None)
+            self._entries[library.name] = (self._identity(library), keywords, names)
+            while self.max_size and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return names
+
+
+_keyword_cache = KeywordCache(KEYWORD_CACHE_SIZE)
 
 
 def get_lib_keywords(library):
     """Get keywords of imported library."""
-    if library.name in _lib_keywords_cache:
-        return _lib_keywords_cache[library.name]
+    keywords = _keyword_cache.get(library)
+    if keywords is not None:
+        return keywords
+    return _load_lib_keywords(library)[0]
 
-    lib = ImportedLibraryDocBuilder().build(library)
-    keywords = []
-    for keyword in lib.keywords:
-        keywords.append(
-            {
-                "name": keyword.name,
-                "lib": library.name,
-                "doc": keyword.doc,
-                "summary": keyword.doc.split("\n")[0],
-            }
-        )
 
-    _lib_keywords_cache[library.name] = keywords
-    return keywords
+def get_lib_keyword_names(library):
+    """Get keywords of imported library by normalized name."""
+    names = _keyword_cache.get_names(library)
+    if names is not None:
+        return names
+    return _load_lib_keywords(library)[1]
+
+
+def _load_lib_keywords(library):
+    stored = load_keywords(library)
+    if stored is None:
+        docs = LibraryDocs(library)
+        keywords = docs.keywords = [
+            LibraryKeyword(handler.name, library.name, handler.doc, docs=docs)
+            for handler in library.handlers
+        ]
+    else:
+        keywords = [
+            LibraryKeyword(
+                keyword["name"], library.name, keyword["doc"], keyword["args"]
+            )
+            for keyword in stored
+        ]
+    return keywords, _keyword_cache.add(library, keywords)
 
 
 def get_keywords():
@@ -67,13 +207,33 @@ def get_keywords():
 
 
 def find_keyword(keyword_name):
-    keyword_name = keyword_name.lower()
-    return [
-        keyword
-        for lib in get_libs()
-        for keyword in get_lib_keywords(lib)
-        if keyword["name"].lower() == keyword_name
-    ]
+    """Find keywords by name, optionally prefixed with library name.
+
+    Case, spaces and underscores are ignored like robotframework does.
+    """
+    normalized = normalize_name(keyword_name)
+    # the library name may contain dots too, try every split
+    splits = []
+    index = keyword_name.find(".")
+    while index >= 0:
+        splits.append(
+            (
+                normalize_name(keyword_name[:index]),
+                normalize_name(keyword_name[index + 1:]),
+            )
+        )
+        index = keyword_name.find(".", index + 1)
+
+    keywords = []
+    prefixed = []
+    for lib in get_libs():
+        names = get_lib_keyword_names(lib)
+        keywords.extend(names.get(normalized, ()))
+        lib_name = normalize_name(lib.name)
+        for prefix, name in splits:
+            if prefix == lib_name:
+                prefixed.extend(names.get(name, ()))
+    return keywords + prefixed
 
 
 def _execute_variable(robot_instance, variable_name, keyword, args):
@@ -110,6 +270,9 @@ def run_keyword(robot_instance, keyword):
 
 
 def run_debug_if(condition, *args):
-    """Runs DEBUG if condition is true."""
+    """Runs DEBUG if condition is true.
 
-    return BuiltIn().run_keyword_if(condition, "DebugLibrary.DEBUG", *args)
+    The condition is evaluated directly, only a true one runs a keyword.
+    """
+    if is_true(condition):
+        return BuiltIn().run_keyword("DebugLibrary.DEBUG", *args)
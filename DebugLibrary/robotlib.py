@@ -1,3 +1,4 @@
+from robot.running.context import EXECUTION_CONTEXTS
 from robot.running.namespace import IMPORTER
 
 
@@ -16,3 +17,13 @@ def match_libs(name=""):
     libs = [_.name for _ in get_libs()]
     matched = [_ for _ in libs if _.lower().startswith(name.lower())]
     return matched
+
+
+def get_library_listeners():
+    """Get listeners registered by libraries of the running suite."""
+    return EXECUTION_CONTEXTS.current.output.library_listeners
+
+
+def get_keyword_depth():
+    """Get the number of running keywords, nested in each other."""
+    return getattr(EXECUTION_CONTEXTS.current, "_started_keywords", 0)
@@ -0,0 +1,153 @@
+import io
+import os
+import socket
+import sys
+from contextlib import contextmanager
+
+SOCKET_PATH = os.environ.get("RFDEBUG_SOCKET", "~/.rfdebug.sock")
+
+# ends the output of a command, or of the last command of a session
+END = "\0"
+END_SESSION = "\x04"
+# seconds between checks for Ctrl-C while waiting for clients
+ACCEPT_TIMEOUT = 0.5
+
+
+@contextmanager
+def captured_output():
+    """Capture everything commands and keywords print, robot console too."""
+    from prompt_toolkit.application import create_app_session
+    from prompt_toolkit.output import create_output
+
+    buffer = io.StringIO()
+    stdout, real_stdout = sys.stdout, sys.__stdout__
+    sys.stdout = sys.__stdout__ = buffer
+    try:
+        with create_app_session(output=create_output(stdout=buffer)):
+            yield buffer
+    finally:
+        sys.stdout, sys.__stdout__ = stdout, real_stdout
+
+
+def run_command(debug_cmd, line):
+    """Run a command line in the shell, return its output and whether to stop.
+
+    Commands handing control back to robot, like ``exit`` or ``step``,
+    end the client session.
+    """
+    debug_cmd.append_command(line)
+    stop = None
+    with captured_output() as output:
+        while debug_cmd.cmdqueue and not stop:
+            stop = debug_cmd.loop_once()
+    return output.getvalue(), stop
+
+
+def _is_serving(path):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+        return True
+    except OSError:
+        return False
+
+
+def serve(debug_cmd, path=SOCKET_PATH):
+    """Serve the debug shell to clients connecting to a unix socket.
+
+    Clients are served one at a time, in the execution context of the
+    running test, until robot is stopped with Ctrl-C.
+    """
+    from robot.running.signalhandler import STOP_SIGNAL_MONITOR
+
+    from .globals import context
+    from .styles import print_output
+
+    path = os.path.expanduser(path)
+    if os.path.exists(path):
+        if _is_serving(path):
+            raise RuntimeError(f"Another debug shell is served on {path}")
+        os.unlink(path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        os.chmod(path, 0o600)
+        server.listen(1)
+        # wake up now and then to notice Ctrl-C, robot only counts signals
+        server.settimeout(ACCEPT_TIMEOUT)
+        print_output("<", f"Serving debug shell on {path}")
+        try:
+            while not STOP_SIGNAL_MONITOR._signal_count:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+                connection.settimeout(None)
+                with connection:
+                    _serve_client(debug_cmd, connection)
+                context.in_step_mode = False
+        finally:
+            os.unlink(path)
+
+
+def _serve_client(debug_cmd, connection):
+    debug_cmd.preloop()
+    reader = connection.makefile(
+        "r", encoding="utf-8", errors="replace", newline="\n"
+    )
+    try:
+        for line in reader:
+            output, stop = run_command(debug_cmd, line.rstrip("\n"))
+            end = END_SESSION if stop else END
+            connection.sendall((output + end).encode("utf-8"))
+            if stop:
+                break
+    except OSError:
+        pass  # the client went away
+    debug_cmd.postloop()
+
+
+def _read_reply(client, pending):
+    """Read output of a command, return it with whether the session ended."""
+    while True:
+        ends = [(pending.find(end.encode()), end) for end in (END, END_SESSION)]
+        found = [(index, end) for index, end in ends if index >= 0]
+        if found:
+            index, end = min(found)
+            reply = pending[:index].decode("utf-8", "replace")
+            del pending[: index + 1]
+            return reply, end == END_SESSION
+        data = client.recv(65536)
+        if not data:
+            return pending.decode("utf-8", "replace"), True
+        pending.extend(data)
+
+
+def connect(path=SOCKET_PATH):
+    """Send command lines to a served debug shell, print what they output."""
+    try:
+        import readline  # noqa: F401, line editing for input()
+    except ImportError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(os.path.expanduser(path))
+        except OSError as error:
+            print(f"Can not connect to debug shell on {path}: {error}")
+            return 1
+        pending = bytearray()
+        stop = False
+        while not stop:
+            try:
+                line = input("> ")
+            except EOFError:
+                line = "exit"
+            except KeyboardInterrupt:
+                print()
+                continue
+            client.sendall((line + "\n").encode("utf-8"))
+            reply, stop = _read_reply(client, pending)
+            sys.stdout.write(reply)
+            sys.stdout.flush()
+    return 0
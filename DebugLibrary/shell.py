@@ -2,8 +2,6 @@ import os
 import sys
 import tempfile
 
-from robot import run_cli
-
 TEST_SUITE = b"""*** Settings ***
 Library  DebugLibrary
 
@@ -12,11 +10,13 @@ RFDEBUG REPL
     debug
 """
 
+# without robot arguments, robot writes no output, log or report
+NO_OUTPUTS = "-l None -x None -o None -L None -r None".split()
 
-def shell():
-    """A standalone robotframework shell."""
 
-    default_no_logs = "-l None -x None -o None -L None -r None"
+def run_suite_file(args):
+    """Run the REPL suite from a file, honoring any robot arguments."""
+    from robot import run_cli
 
     with tempfile.NamedTemporaryFile(
         prefix="robot-debug-", suffix=".robot", delete=False
@@ -24,13 +24,8 @@ def shell():
         test_file.write(TEST_SUITE)
         test_file.flush()
 
-        if len(sys.argv) > 1:
-            args = sys.argv[1:] + [test_file.name]
-        else:
-            args = default_no_logs.split() + [test_file.name]
-
         try:
-            sys.exit(run_cli(args))
+            return run_cli(args + [test_file.name], exit=False)
         finally:
             test_file.close()
             # pybot will raise PermissionError on Windows NT or later
@@ -40,6 +35,37 @@ def shell():
                 os.unlink(test_file.name)
 
 
+def shell():
+    """A standalone robotframework shell.
+
+    ``--server`` serves the shell on a unix socket, ``--connect`` runs a
+    lightweight client of it. ``--batch <file>`` runs the keyword lines of
+    a file, or of stdin if the file is ``-``, and prints results as JSON
+    lines. Other arguments are passed to robot.
+    """
+    args = sys.argv[1:]
+    if "--connect" in args:
+        from DebugLibrary.server import SOCKET_PATH, connect
+
+        sys.exit(connect(SOCKET_PATH))
+    if "--server" in args:
+        from DebugLibrary.globals import context
+        from DebugLibrary.server import SOCKET_PATH
+
+        args.remove("--server")
+        context.server_path = SOCKET_PATH
+    if "--batch" in args:
+        from DebugLibrary.globals import context
+
+        index = args.index("--batch")
+        context.batch_path = args[index + 1] if index + 1 < len(args) else "-"
+        del args[index : index + 2]
+        # robot's console output would mix with the results
+        args = NO_OUTPUTS + ["--console", "none"] + args
+
+    sys.exit(run_suite_file(args or NO_OUTPUTS))
+
+
 if __name__ == "__main__":
     # Usage: python -m DebugLibrary.shell
     shell()
@@ -0,0 +1,87 @@
+import codecs
+import mmap
+import os
+
+# files larger than this are mapped into memory instead of read
+MMAP_THRESHOLD = 1024 * 1024
+
+_source_cache = {}
+
+
+class SourceFile:
+    """Lines of a source file, indexed by the offset of every line start.
+
+    Supports ``len()``, indexing and slicing like the list returned by
+    ``readlines()``, but decodes only the lines that are accessed.
+    """
+
+    # index of test case and keyword blocks, built by sourcelines
+    block_index = None
+
+    def __init__(self, path, stat):
+        self.path = path
+        self.mtime = stat.st_mtime_ns
+        self.size = stat.st_size
+        self._mmap = None
+        with open(path, "rb") as source:
+            if self.size >= MMAP_THRESHOLD:
+                self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+                self._data = self._mmap
+            else:
+                self._data = source.read()
+        self._offsets = self._index_lines()
+
+    def _index_lines(self):
+        data = self._data
+        start = len(codecs.BOM_UTF8) if data[:3] == codecs.BOM_UTF8 else 0
+        offsets = [start]
+        end = data.find(b"\n", start)
+        while end >= 0:
+            offsets.append(end + 1)
+            end = data.find(b"\n", end + 1)
+        if offsets[-1] < len(data):
+            offsets.append(len(data))  # last line without newline
+        return offsets
+
+    def is_valid(self, stat):
+        """Check the file is unchanged since it was indexed."""
+        return self.mtime == stat.st_mtime_ns and self.size == stat.st_size
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def line(self, index):
+        """Get a line by 0 based index, without the line ending."""
+        data = self._data[self._offsets[index]:self._offsets[index + 1]]
+        return data.decode("utf-8", "replace").rstrip("\r\n")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.line(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return self.line(index)
+
+
+def get_source_file(path):
+    """Get the cached lines of a source file, re-index it if changed."""
+    stat = os.stat(path)
+    source = _source_cache.get(path)
+    if source is not None and source.is_valid(stat):
+        return source
+    if source is not None:
+        source.close()
+    source = _source_cache[path] = SourceFile(path, stat)
+    return source
+
+
+def get_source_line(path, lineno):
+    """Get a line of a source file by 1 based line number."""
+    return get_source_file(path)[lineno - 1]
@@ -1,5 +1,10 @@
+import ast
+from bisect import bisect_right
+
 from robot.version import get_version
 
+from .sourcecache import get_source_file
+
 ROBOT_VERION_RUNNER_GET_STEP_LINENO = "3.2"
 
 
@@ -18,7 +23,7 @@ def print_source_lines(source_file, lineno, before_and_after=5):
     if not source_file or not lineno:
         return
 
-    lines = open(source_file).readlines()
+    lines = get_source_file(source_file)
     start_index = max(1, lineno - before_and_after - 1)
     end_index = min(len(lines) + 1, lineno + before_and_after)
     _print_lines(lines, start_index, end_index, lineno)
@@ -30,44 +35,58 @@ def print_test_case_lines(source_file, current_lineno):
     if not source_file or not current_lineno:
         return
 
-    lines = open(source_file).readlines()
+    block = get_block_index(source_file).find(current_lineno)
+    if block is None:
+        # not inside a test case or keyword, e.g. a suite setup
+        print_source_lines(source_file, current_lineno)
+        return
+
+    start_lineno, end_lineno = block
+    lines = get_source_file(source_file)
+    _print_lines(lines, start_lineno - 1, end_lineno, current_lineno)
+
+
+class BlockIndex:
+    """Line ranges of the test cases and keywords in a file."""
+
+    def __init__(self, lines):
+        from robot.api import get_model  # robotframework >= 3.2
 
-    # find the first line of current test case
-    start_index = _find_first_lineno(lines, current_lineno)
-    # find the last line of current test case
-    end_index = _find_last_lineno(lines, current_lineno)
+        finder = _BlockFinder()
+        finder.visit(get_model(lines.path))
+        self.starts = []
+        self.ends = []
+        for start, end in sorted(finder.blocks):
+            # do not show blank lines separating blocks
+            while end > start and not lines[end - 1].strip():
+                end -= 1
+            self.starts.append(start)
+            self.ends.append(end)
 
-    _print_lines(lines, start_index, end_index, current_lineno)
+    def find(self, lineno):
+        """Get first and last line numbers of the block enclosing a line."""
+        index = bisect_right(self.starts, lineno) - 1
+        if index >= 0 and lineno <= self.ends[index]:
+            return self.starts[index], self.ends[index]
+        return None
 
 
-def _find_last_lineno(lines, begin_lineno):
-    line_index = begin_lineno - 1
-    while line_index < len(lines):
-        line = lines[line_index]
-        if not _inside_test_case_block(line):
-            break
-        line_index += 1
-    return line_index
+class _BlockFinder(ast.NodeVisitor):
+    def __init__(self):
+        self.blocks = []
 
+    def visit_TestCase(self, node):
+        self.blocks.append((node.lineno, node.end_lineno))
 
-def _find_first_lineno(lines, begin_lineno):
-    line_index = begin_lineno - 1
-    while line_index >= 0:
-        line_index -= 1
-        line = lines[line_index]
-        if not _inside_test_case_block(line):
-            break
-    return line_index
+    visit_Keyword = visit_TestCase
 
 
-def _inside_test_case_block(line):
-    if line.startswith(" "):
-        return True
-    if line.startswith("\t"):
-        return True
-    if line.startswith("#"):
-        return True
-    return False
+def get_block_index(source_file):
+    """Get block index of a file, cached until the file changes."""
+    lines = get_source_file(source_file)
+    if lines.block_index is None:
+        lines.block_index = BlockIndex(lines)
+    return lines.block_index
 
 
 def _print_lines(lines, start_index, end_index, current_lineno):
@@ -1,52 +1,181 @@
-import inspect
+import sys
 
 from .globals import context
+from .profiler import profile_name
+from .robotlib import get_keyword_depth, get_library_listeners
+from .sourcecache import get_source_line
 
 
-class RobotLibraryStepListener:
+class StepListener:
+    """Keyword listener, registered to robot only while step mode is on or
+    breakpoints are set."""
+
     ROBOT_LISTENER_API_VERSION = 2
 
-    def __init__(self):
-        super(RobotLibraryStepListener, self).__init__()
-        self.ROBOT_LIBRARY_LISTENER = [self]
+    def __init__(self, library):
+        self.library = library
+        # keywords started and not yet ended
+        self.depth = 0
+
+    def attach(self):
+        """Start receiving keyword events."""
+        self.depth = get_keyword_depth()
+        listeners = get_library_listeners()
+        # use the listener itself as the owner to unregister only this one
+        listeners.unregister(self)
+        listeners.register([self], self)
+
+    def detach(self):
+        """Stop receiving keyword events."""
+        get_library_listeners().unregister(self)
+
+    def _start_test(self, name, attrs):
+        if context.step_depth is not None:
+            # stepping out of a test stops at the first keyword of the next
+            context.step_depth = max(context.step_depth, 1)
+
+    def _end_keyword(self, name, attrs):
+        self.depth -= 1
 
     def _start_keyword(self, name, attrs):
+        self.depth += 1
+        if not context.in_step_mode and not context.breakpoints:
+            # left over in a parent suite scope
+            self.detach()
+            return
+
+        point = None
+        if context.breakpoints:
+            point = context.breakpoints.match(
+                name, attrs.get("kwname"), lambda: locate_step(attrs)
+            )
+        if point is None:
+            if not context.in_step_mode or not self.is_step_reached(attrs):
+                return  # run at full speed to the next stop
+        else:
+            print("Breakpoint {}".format(point))
+
         context.current_source_path = ""
         context.current_source_lineno = 0
 
-        if not context.in_step_mode:
-            return
-
-        find_runner_step()
-        step = context.current_runner_step
+        path, lineno = locate_step(attrs)
 
-        if hasattr(step, "lineno"):
-            path = step.source
-            lineno = step.lineno
-            lineno_0_based = lineno - 1
+        if lineno:
             context.current_source_path = path
             context.current_source_lineno = lineno
             print("> {}({})".format(path, lineno))
-            line = open(path).readlines()[lineno_0_based].strip()
+            line = get_source_line(path, lineno).strip()
             print("-> {}".format(line))
 
         if attrs["assign"]:
             assign = "%s = " % ", ".join(attrs["assign"])
         else:
             assign = ""
-            name = "{}.{}".format(attrs["libname"], attrs["kwname"])
+            if attrs["libname"]:
+                name = "{}.{}".format(attrs["libname"], attrs["kwname"])
 
         translated = "{}{}  {}".format(assign, name, "  ".join(attrs["args"]))
         print("=> {}".format(translated))
 
         # callback debug interface
-        self.debug()
+        self.library.debug()
+
+    def is_step_reached(self, attrs):
+        """Check whether step mode stops at a keyword at the current depth.
+
+        `next` and `until` stop only at keywords as deep as the last stop
+        or shallower, `finish` only at shallower ones, and `until` only at
+        lines after the given one in the same file.
+        """
+        if context.step_depth is not None and self.depth > context.step_depth:
+            return False
+        if context.step_until is not None:
+            path, lineno = locate_step(attrs)
+            until_path, until_lineno = context.step_until
+            if path == until_path and lineno < until_lineno:
+                return False
+        return True
+
+
+class ProfileListener:
+    """Keyword listener feeding the profiler, registered while profiling."""
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def attach(self):
+        listeners = get_library_listeners()
+        listeners.unregister(self)
+        listeners.register([self], self)
+
+    def detach(self):
+        get_library_listeners().unregister(self)
+
+    def _start_keyword(self, name, attrs):
+        if context.profiler is None:
+            self.detach()
+            return
+        context.profiler.start_keyword(profile_name(name, attrs))
+
+    def _end_keyword(self, name, attrs):
+        if context.profiler is not None:
+            context.profiler.end_keyword()
+
+
+class RobotLibraryStepListener:
+    """Library listener which attaches the keyword listener on demand.
+
+    Keyword events are not delivered at all while no debug feature needs
+    them, so an imported but idle library costs nothing per keyword.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        super(RobotLibraryStepListener, self).__init__()
+        self.step_listener = StepListener(self)
+        self.profile_listener = ProfileListener()
+        self.ROBOT_LIBRARY_LISTENER = [self]
+
+    def _start_suite(self, name, attrs):
+        # listeners registered on the fly do not outlive their suite scope
+        self._update_step_listener()
+
+    def _update_step_listener(self):
+        """Attach or detach the keyword listeners as debug features require."""
+        if context.in_step_mode or context.breakpoints:
+            self.step_listener.attach()
+        else:
+            self.step_listener.detach()
+        if context.profiler is not None:
+            self.profile_listener.attach()
+        else:
+            self.profile_listener.detach()
+
+
+def locate_step(attrs):
+    """Get source path and line number of the keyword being started.
+
+    robotframework >= 4.0 passes both in the listener attributes, older
+    versions only keep them on the running step.
+    """
+    if "lineno" in attrs:
+        return attrs.get("source") or "", attrs.get("lineno") or 0
+
+    find_runner_step()
+    step = context.current_runner_step
+    if hasattr(step, "lineno"):
+        return step.source, step.lineno
+    return "", 0
 
 
 def find_runner_step():
-    stack = inspect.stack()
-    for frame in stack:
-        if frame.function == "run_steps":
-            arginfo = inspect.getargvalues(frame.frame)
-            context.current_runner = arginfo.locals.get("runner")
-            context.current_runner_step = arginfo.locals.get("step")
+    """Find the innermost running step, for robotframework < 4.0 only."""
+    context.current_runner = None
+    context.current_runner_step = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_name == "run_steps":
+            context.current_runner = frame.f_locals.get("runner")
+            context.current_runner_step = frame.f_locals.get("step")
+            return
+        frame = frame.f_back
@@ -0,0 +1,61 @@
+"""Keyword lines per second in batch mode and through the interactive shell.
+
+Feeds the same keyword lines to ``rfrepl --batch -`` and, typed line by
+line with pexpect, to the interactive shell.
+
+Usage: python benchmarks/batch.py [lines] [interactive lines]
+"""
+import subprocess
+import sys
+import time
+
+import pexpect
+
+LINES = ["${value} =  Set Variable  42", "Should Be Equal  ${value}  42"]
+
+
+def make_lines(count):
+    return [LINES[index % len(LINES)] for index in range(count)]
+
+
+def run_batch(lines):
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "DebugLibrary.shell", "--batch", "-"],
+        input="\n".join(lines) + "\n",
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    return time.perf_counter() - started
+
+
+def run_interactive(lines):
+    started = time.perf_counter()
+    child = pexpect.spawn(sys.executable, ["-m", "DebugLibrary.shell"])
+    child.delaybeforesend = None
+    child.expect("Enter interactive shell", timeout=30)
+    child.expect("> ", timeout=30)
+    for line in lines:
+        child.sendline(line)
+        child.expect("> ", timeout=30)
+    child.sendline("exit")
+    child.expect(pexpect.EOF, timeout=30)
+    return time.perf_counter() - started
+
+
+def main(lines=5000, interactive_lines=200):
+    for label, run, count in (
+        ("batch", run_batch, lines),
+        ("interactive", run_interactive, interactive_lines),
+    ):
+        elapsed = run(make_lines(count))
+        print(
+            f"{label:12} {count:6} lines  {elapsed:6.2f} s  "
+            f"{count / elapsed:8.0f} lines/s"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,84 @@
+"""Cost of command completion lookups per keystroke.
+
+Compares the linear scan over every name with the prefix index, and times
+fuzzy lookups and indexing one more library, for a synthetic vocabulary of
+libraries and keywords indexed library by library.
+
+Usage: python benchmarks/completion.py [libraries] [keywords per library]
+"""
+import random
+import sys
+import timeit
+
+from DebugLibrary.cmdcompleter import FuzzyIndex, PrefixIndex
+
+PREFIXES = ["g", "get t", "lib7.", "lib7.get t", "nothing"]
+QUERIES = ["wuev", "sbe", "getel", "lib7.wuev", "xyz"]
+WORDS = (
+    "get set wait until element page text should be is visible enabled "
+    "contains equal click input select list value attribute count open close"
+).split()
+
+
+def make_library_names(rand, lib, keywords):
+    names = [f"Lib{lib}"]
+    for keyword in range(keywords):
+        words = rand.sample(WORDS, rand.randint(2, 5))
+        name = " ".join(words).title() + f" {keyword}"
+        names.extend([f"Lib{lib}.{name}", name])
+    return names
+
+
+def make_groups(libraries, keywords):
+    rand = random.Random(0)
+    return {
+        f"Lib{lib}": make_library_names(rand, lib, keywords)
+        for lib in range(libraries)
+    }
+
+
+def linear_scan(names, text):
+    """The lookup used before, kept here for comparison."""
+    return [
+        name
+        for name in names
+        if (("." not in name and "." not in text) or ("." in name and "." in text))
+        and name.lower().strip().startswith(text.strip())
+    ]
+
+
+def main(libraries=30, keywords=300):
+    groups = make_groups(libraries, keywords)
+    names = [name for group in groups.values() for name in group]
+    index = PrefixIndex()
+    fuzzy = FuzzyIndex()
+    for group, group_names in groups.items():
+        index.set_group(group, group_names)
+        fuzzy.set_group(group, group_names)
+    print(f"names: {len(names)}")
+    new_library = make_library_names(random.Random(1), libraries, keywords)
+    elapsed = timeit.timeit(
+        lambda: (
+            index.set_group("new", new_library),
+            fuzzy.set_group("new", new_library),
+        ),
+        number=10,
+    )
+    print(f"index one more library in {elapsed / 10 * 1000:.3f} ms")
+    for text in PREFIXES:
+        matches = len(list(index.find(text)))
+        before = timeit.timeit(lambda: linear_scan(names, text), number=10) / 10
+        after = timeit.timeit(lambda: list(index.find(text)), number=10) / 10
+        print(
+            f"{text!r:14} {matches:6} matches  "
+            f"scan {before * 1000:8.3f} ms  index {after * 1000:8.3f} ms"
+        )
+    for text in QUERIES:
+        matches = fuzzy.find(text)
+        elapsed = timeit.timeit(lambda: fuzzy.find(text), number=10) / 10
+        best = matches[0] if matches else ""
+        print(f"fuzzy {text!r:12} {elapsed * 1000:8.3f} ms  best: {best}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
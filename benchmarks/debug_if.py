@@ -0,0 +1,63 @@
+"""Per-iteration cost of a false ``Debug If`` in a FOR loop.
+
+Runs a loop of the given keyword line, compared to an empty loop and to
+``Run Keyword If`` running the Debug keyword, which ``Debug If`` used to
+go through.
+
+Usage: python benchmarks/debug_if.py [iterations]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+from robot import run
+
+SUITE = """\
+*** Settings ***
+Library  DebugLibrary
+
+*** Test Cases ***
+Loop
+    FOR  ${{i}}  IN RANGE  {iterations}
+        No Operation
+        {line}
+    END
+"""
+
+LINES = {
+    "empty loop": "",
+    "Run Keyword If  $i < 0": "Run Keyword If  $i < 0  DebugLibrary.Debug",
+    "Debug If  $i < 0": "Debug If  $i < 0",
+    "Debug If  ${i} < 0": "Debug If  ${i} < 0",
+}
+
+
+def run_suite(iterations, line):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "debug_if.robot")
+        with open(path, "w") as suite_file:
+            suite_file.write(SUITE.format(iterations=iterations, line=line))
+        start = time.perf_counter()
+        rc = run(path, output=None, log=None, report=None, stdout=io.StringIO())
+        elapsed = time.perf_counter() - start
+    assert rc == 0, f"suite failed with {line!r}"
+    return elapsed
+
+
+def main(iterations=10000):
+    print(f"iterations: {iterations}")
+    baseline = None
+    for name, line in LINES.items():
+        elapsed = run_suite(iterations, line)
+        if baseline is None:
+            baseline = elapsed
+            print(f"{name:24} {elapsed / iterations * 1e6:8.2f} us/iteration")
+        else:
+            overhead = (elapsed - baseline) / iterations * 1e6
+            print(f"{name:24} {overhead:8.2f} us/iteration more")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,53 @@
+"""Time from entering the Debug keyword to the first prompt.
+
+Runs a suite importing some libraries and calling ``Debug``, with an empty
+keyword store so every library is indexed from scratch.
+
+Usage: python benchmarks/first_prompt.py [library ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pexpect
+
+LIBRARIES = ["String", "Collections", "OperatingSystem", "DateTime", "Process", "XML"]
+
+SUITE = """\
+*** Settings ***
+Library  DebugLibrary
+{libraries}
+
+*** Test Cases ***
+First Prompt
+    Debug
+"""
+
+
+def main(libraries):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "first_prompt.robot")
+        with open(path, "w") as suite_file:
+            suite_file.write(
+                SUITE.format(libraries="\n".join(f"Library  {_}" for _ in libraries))
+            )
+        env = dict(os.environ, RFDEBUG_CACHE=os.path.join(tmpdir, "cache"))
+        child = pexpect.spawn(
+            sys.executable,
+            ["-m", "robot", "-o", "NONE", "-l", "NONE", "-r", "NONE", path],
+            env=env,
+        )
+        child.expect("Enter interactive shell", timeout=30)
+        entered = time.perf_counter()
+        child.expect("> ", timeout=30)
+        prompted = time.perf_counter()
+        child.sendeof()
+        child.expect(pexpect.EOF, timeout=30)
+
+    print(f"libraries: {', '.join(libraries)}")
+    print(f"time to first prompt: {(prompted - entered) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or LIBRARIES)
@@ -0,0 +1,66 @@
+"""Time to load a large history file and to suggest from it per keystroke.
+
+Writes a history file in FileHistory format and loads it with the whole
+file FileHistory and with the bounded history read from the end, then
+times suggestions of AutoSuggestFromHistory and of the history index.
+
+Usage: python benchmarks/history.py [entries] [distinct commands]
+"""
+import os
+import sys
+import tempfile
+import time
+import timeit
+from types import SimpleNamespace
+
+from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+from prompt_toolkit.document import Document
+from prompt_toolkit.history import FileHistory
+
+from DebugLibrary.history import AutoSuggestFromIndex, BoundedFileHistory
+
+TYPED = ["l", "lo", "log  1", "log  4999", "x"]
+
+
+def write_history(path, entries, distinct):
+    with open(path, "w", encoding="utf-8") as history_file:
+        for index in range(entries):
+            history_file.write(f"\n# 2020-01-01 00:00:00\n+log  {index % distinct}\n")
+
+
+def load(history):
+    started = time.perf_counter()
+    count = sum(1 for _ in history.load_history_strings())
+    return count, time.perf_counter() - started
+
+
+def main(entries=300000, distinct=50000):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "history")
+        write_history(path, entries, distinct)
+        print(f"entries: {entries}, file: {os.path.getsize(path) // 1024} KB")
+        for label, history in (
+            ("FileHistory", FileHistory(path)),
+            ("bounded", BoundedFileHistory(path)),
+            ("bounded again", BoundedFileHistory(path)),
+        ):
+            count, elapsed = load(history)
+            print(f"{label:14} {count:7} loaded  {elapsed * 1000:8.1f} ms")
+
+        # what AutoSuggestFromHistory walks, oldest first
+        strings = list(history.load_history_strings())[::-1]
+        buffer = SimpleNamespace(history=SimpleNamespace(get_strings=lambda: strings))
+        for label, suggester in (
+            ("from history", AutoSuggestFromHistory()),
+            ("from index", AutoSuggestFromIndex(history.index)),
+        ):
+            for text in TYPED:
+                document = Document(text)
+                elapsed = timeit.timeit(
+                    lambda: suggester.get_suggestion(buffer, document), number=20
+                )
+                print(f"{label:14} {text!r:12} {elapsed / 20 * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
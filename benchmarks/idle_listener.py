@@ -0,0 +1,62 @@
+"""Per-keyword cost of an imported but idle DebugLibrary.
+
+Runs the same generated suite with and without ``Library  DebugLibrary``
+and counts how often the step listener is called.
+
+Usage: python benchmarks/idle_listener.py [keywords]
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+from robot import run
+
+from DebugLibrary.steplistener import StepListener
+
+SUITE = """\
+*** Settings ***
+{settings}
+
+*** Test Cases ***
+Idle
+{keywords}
+"""
+
+calls = 0
+_start_keyword = StepListener._start_keyword
+
+
+def counting_start_keyword(self, name, attrs):
+    global calls
+    calls += 1
+    return _start_keyword(self, name, attrs)
+
+
+def run_suite(keywords, settings):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "idle.robot")
+        with open(path, "w") as suite_file:
+            suite_file.write(
+                SUITE.format(
+                    settings=settings, keywords="    No Operation\n" * keywords
+                )
+            )
+        start = time.perf_counter()
+        run(path, output=None, log=None, report=None, stdout=io.StringIO())
+        return time.perf_counter() - start
+
+
+def main(keywords=20000):
+    StepListener._start_keyword = counting_start_keyword
+    without = run_suite(keywords, "")
+    with_lib = run_suite(keywords, "Library  DebugLibrary")
+    print(f"keywords: {keywords}")
+    print(f"without DebugLibrary: {without / keywords * 1e6:8.2f} us/keyword")
+    print(f"with idle DebugLibrary: {with_lib / keywords * 1e6:6.2f} us/keyword")
+    print(f"step listener calls: {calls}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
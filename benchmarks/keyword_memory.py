@@ -0,0 +1,106 @@
+"""Memory held per keyword by the keyword table and completion entries.
+
+Builds keywords and completion entries for a synthetic set of libraries,
+the way the shell does, and compares with the per-keyword dicts and
+display tuples used before.
+
+Usage: python benchmarks/keyword_memory.py [libraries] [keywords per library]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+from DebugLibrary.cmdcompleter import library_commands
+from DebugLibrary.robotkeyword import normalize_name
+
+WORDS = (
+    "get set wait until element page text should be is visible enabled "
+    "contains equal click input select list value attribute count open close"
+).split()
+
+
+def make_libraries(libraries, keywords):
+    rand = random.Random(0)
+    result = []
+    for lib in range(libraries):
+        handlers = []
+        for keyword in range(keywords):
+            words = rand.sample(WORDS, rand.randint(2, 5))
+            name = " ".join(words).title() + f" {keyword}"
+            doc = f"{name} does things.\n\n" + " ".join(rand.choices(WORDS, k=40))
+            handlers.append(SimpleNamespace(name=name, doc=doc))
+        result.append(
+            SimpleNamespace(
+                name=f"Lib{lib}", version="1.0", source=None, handlers=handlers
+            )
+        )
+    return result
+
+
+class OldLibraryKeyword:
+    """The keyword record used before, kept here for comparison."""
+
+    def __init__(self, name, lib, summary, docs):
+        self.name = name
+        self.lib = lib
+        self.summary = summary
+        self._docs = docs
+
+
+def old_tables(libraries):
+    keywords, index, displays, display_metas = [], {}, {}, {}
+    for lib in libraries:
+        lib_keywords = [
+            OldLibraryKeyword(handler.name, lib.name, handler.doc.split("\n")[0], None)
+            for handler in lib.handlers
+        ]
+        keywords.append(lib_keywords)
+        for keyword in lib_keywords:
+            index.setdefault(normalize_name(keyword.name), []).append(keyword)
+        _commands = [(lib.name, lib.name, f"Library: {lib.name} {lib.version}")]
+        for keyword in lib_keywords:
+            name = f"{keyword.lib}.{keyword.name}"
+            _commands.append((name, keyword.name, f"Keyword: {keyword.summary}"))
+            _commands.append(
+                (keyword.name, keyword.name, f"Keyword[{keyword.lib}.]: {keyword.summary}")
+            )
+        for name, display, display_meta in _commands:
+            displays[name] = display
+            display_metas[name] = display_meta
+        keywords.append([name for name, _, _ in _commands])
+    return keywords, index, displays, display_metas
+
+
+def new_tables(libraries):
+    entries, names = {}, []
+    for lib in libraries:
+        _commands = library_commands(lib)
+        entries.update(_commands)
+        names.append([name for name, _ in _commands])
+    return entries, names
+
+
+def measure(build, libraries):
+    gc.collect()
+    tracemalloc.start()
+    tables = build(libraries)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tables
+    return size
+
+
+def main(libraries=40, keywords=500):
+    libs = make_libraries(libraries, keywords)
+    total = libraries * keywords
+    before = measure(old_tables, libs)
+    after = measure(new_tables, libs)
+    print(f"keywords: {total}")
+    print(f"before: {before / 1024 / 1024:6.2f} MB  {before / total:6.0f} B/keyword")
+    print(f"after:  {after / 1024 / 1024:6.2f} MB  {after / total:6.0f} B/keyword")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,54 @@
+"""Time to index keywords and answer search queries.
+
+Indexes a synthetic set of libraries with documented keywords, then times
+queries of common, rare and prefix words.
+
+Usage: python benchmarks/search.py [libraries] [keywords per library]
+"""
+import random
+import sys
+import time
+import timeit
+from types import SimpleNamespace
+
+from DebugLibrary.keywordsearch import SearchIndex
+
+QUERIES = ["element", "wait visible", "page contains text", "attr", "xyz"]
+WORDS = (
+    "get set wait until element page text should be is visible enabled "
+    "contains equal click input select list value attribute count open close "
+    "the a of to and in for with given returns fails if not"
+).split()
+
+
+def make_keyword(rand, lib, keyword):
+    name = " ".join(rand.sample(WORDS[:24], rand.randint(2, 5))).title()
+    return SimpleNamespace(
+        name=f"{name} {keyword}",
+        lib=lib,
+        doc=" ".join(rand.choices(WORDS, k=rand.randint(10, 80))),
+        args=[f"{word}_{index}" for index, word in enumerate(rand.sample(WORDS, 3))],
+    )
+
+
+def main(libraries=40, keywords=500):
+    rand = random.Random(0)
+    index = SearchIndex()
+    started = time.perf_counter()
+    for lib in range(libraries):
+        library = SimpleNamespace(name=f"Lib{lib}", handlers=[])
+        index.add_library(
+            library, [make_keyword(rand, library.name, _) for _ in range(keywords)]
+        )
+    print(f"keywords: {libraries * keywords}")
+    print(f"indexed in {(time.perf_counter() - started) * 1000:.0f} ms")
+    index.search("warm up")
+    for text in QUERIES:
+        results = index.search(text)
+        elapsed = timeit.timeit(lambda: index.search(text), number=10) / 10
+        best = results[0].name if results else ""
+        print(f"{text!r:22} {elapsed * 1000:8.3f} ms  best: {best}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
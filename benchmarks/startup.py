@@ -0,0 +1,46 @@
+"""Time from starting rfrepl to its first prompt.
+
+Compares it with the time to only import robot's runner and prompt_toolkit,
+which bounds how fast rfrepl can start.
+
+Usage: python benchmarks/startup.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+import pexpect
+
+
+def time_to_prompt():
+    started = time.perf_counter()
+    child = pexpect.spawn(sys.executable, ["-m", "DebugLibrary.shell"])
+    child.expect("Enter interactive shell", timeout=30)
+    child.expect("> ", timeout=30)
+    prompted = time.perf_counter()
+    child.sendline("exit")
+    child.expect(pexpect.EOF, timeout=30)
+    return prompted - started
+
+
+def time_to_import():
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "import robot.running, prompt_toolkit"], check=True
+    )
+    return time.perf_counter() - started
+
+
+def main(runs=5):
+    measures = (("rfrepl prompt", time_to_prompt), ("imports", time_to_import))
+    for label, measure in measures:
+        times = [measure() for _ in range(runs)]
+        print(
+            f"{label:14} median {statistics.median(times) * 1000:7.1f} ms  "
+            f"min {min(times) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
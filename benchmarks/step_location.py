@@ -0,0 +1,48 @@
+"""Per-keyword cost of locating the current step in the step listener.
+
+Compares the old ``inspect.stack()`` walk with the listener attribute based
+lookup, from a call stack about as deep as a nested robot suite.
+
+Usage: python benchmarks/step_location.py [stack depth] [iterations]
+"""
+import inspect
+import sys
+import timeit
+
+from DebugLibrary.steplistener import locate_step
+
+ATTRS = {
+    "kwname": "Log To Console",
+    "libname": "BuiltIn",
+    "args": ["working"],
+    "assign": [],
+    "source": "/tmp/some.robot",
+    "lineno": 7,
+}
+
+
+def inspect_stack_lookup():
+    """The lookup used before, kept here for comparison."""
+    for frame in inspect.stack():
+        if frame.function == "run_steps":
+            arginfo = inspect.getargvalues(frame.frame)
+            arginfo.locals.get("step")
+
+
+def run_steps(depth, func, number, step=None):
+    if depth:
+        return run_steps(depth - 1, func, number, step)
+    return timeit.timeit(func, number=number)
+
+
+def main(depth=80, number=200):
+    before = run_steps(depth, inspect_stack_lookup, number)
+    after = run_steps(depth, lambda: locate_step(ATTRS), number)
+    print(f"stack depth: {depth}, keywords: {number}")
+    print(f"inspect.stack():     {before / number * 1e6:10.2f} us/keyword")
+    print(f"listener attributes: {after / number * 1e6:10.2f} us/keyword")
+    print(f"speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BATCH = """\
+# comments and blank lines are skipped
+${x} =  Set Variable  42
+log to console  hello ${x}
+
+Should Be Equal  ${x}  43
+Get Length  abc
+"""
+
+
+def run_batch(text, args=(), cwd=None, path="-"):
+    return subprocess.run(
+        [sys.executable, os.path.join(ROOT, "DebugLibrary", "shell.py")]
+        + ["--batch", path]
+        + list(args),
+        input=text,
+        cwd=cwd,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        timeout=30,
+    )
+
+
+def test_batch():
+    process = run_batch(BATCH)
+    records = [json.loads(line) for line in process.stdout.splitlines()]
+    assert [record["line"] for record in records] == [2, 3, 5, 6]
+    assert records[0]["result"] == "${x} = '42'"
+    assert records[1]["console"] == "hello 42\n"
+    assert records[2]["status"] == "FAIL"
+    assert "42 != 43" in records[2]["error"]
+    assert records[3] == {
+        "line": 6,
+        "command": "Get Length  abc",
+        "status": "PASS",
+        "result": "3",
+        "console": "",
+    }
+    assert "4 lines executed, 1 failed" in process.stderr
+    assert process.returncode == 1
+
+    assert run_batch("Get Length  abc\n").returncode == 0
+
+
+def test_batch_with_robot_args(tmp_path):
+    process = run_batch(BATCH, ["--loglevel", "DEBUG"], cwd=str(tmp_path))
+    records = [json.loads(line) for line in process.stdout.splitlines()]
+    assert len(records) == 4
+    assert list(tmp_path.iterdir()) == []  # no output, log or report
+
+
+def test_batch_missing_file(tmp_path):
+    path = str(tmp_path / "missing.robot")
+    process = run_batch("", path=path)
+    assert process.stdout == ""
+    assert f"cannot run batch: [Errno 2] No such file or directory: '{path}'" in (
+        process.stderr
+    )
+    assert process.returncode == 1
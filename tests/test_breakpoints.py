@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from DebugLibrary.breakpoints import BreakpointTable, BreakpointUsageError
+
+
+def no_location():
+    raise AssertionError("located without line breakpoints")
+
+
+def test_keyword_breakpoints():
+    table = BreakpointTable()
+    assert not table
+    table.add("log to console")
+    table.add("My_Keyword")
+
+    assert table.match("BuiltIn.Log", "Log", no_location) is None
+    point = table.match("BuiltIn.Log To Console", "Log To Console", no_location)
+    assert point.number == 1
+    assert point.hits == 1
+    assert table.match("my keyword", "my keyword", no_location).number == 2
+
+
+def test_line_breakpoints():
+    table = BreakpointTable()
+    point = table.add("suite.robot:7")
+    assert point.path == "suite.robot"
+    assert point.lineno == 7
+
+    source = os.path.join(os.sep, "tests", "suite.robot")
+    assert table.match("Log", "Log", lambda: (source, 7)) is point
+    assert table.match("Log", "Log", lambda: (source, 8)) is None
+    other = os.path.join(os.sep, "tests", "other_suite.robot")
+    assert table.match("Log", "Log", lambda: (other, 7)) is None
+
+
+def test_remove_and_clear():
+    table = BreakpointTable()
+    table.add("Log")
+    table.add("Sleep")
+    assert table.remove(1).keyword == "Log"
+    assert table.remove(1) is None
+    assert table.match("Log", "Log", no_location) is None
+    assert [point.number for point in table] == [2]
+    table.clear()
+    assert not table
+    assert table.add("Log").number == 3
+
+
+def test_parse_condition():
+    table = BreakpointTable()
+    assert table.add("Log  if  ${i} > 3").condition == "${i} > 3"
+    assert table.add("Log  $i > 3").condition == "$i > 3"
+    with pytest.raises(BreakpointUsageError):
+        table.add("  ")
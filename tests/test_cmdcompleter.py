@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+from DebugLibrary import cmdcompleter
+from DebugLibrary.cmdcompleter import CmdCompleter, FuzzyIndex, PrefixIndex
+
+NAMES = [
+    "help",
+    "BuiltIn",
+    "Should Be Equal",
+    "Should_Be_Equal_As_Integers",
+    "BuiltIn.Should Be Equal",
+    "Wait Until Element Is Visible",
+    "Element Should Be Visible",
+    "SeleniumLibrary.Wait Until Element Is Visible",
+]
+
+
+def test_prefix_index():
+    index = PrefixIndex(NAMES)
+    assert list(index.find("should")) == [
+        "Should Be Equal",
+        "Should_Be_Equal_As_Integers",
+    ]
+    assert list(index.find("builtin.")) == ["BuiltIn.Should Be Equal"]
+    assert list(index.find("nothing")) == []
+
+
+def test_fuzzy_index():
+    index = FuzzyIndex(NAMES)
+    assert index.find("wuev") == ["Wait Until Element Is Visible"]
+    assert index.find("sbeai") == ["Should_Be_Equal_As_Integers"]
+    assert index.find("elvis")[0] == "Element Should Be Visible"
+    assert index.find("sel.wuev") == ["SeleniumLibrary.Wait Until Element Is Visible"]
+    assert index.find("sbe", limit=1) == ["Should Be Equal"]
+    assert index.find("xyz") == []
+
+
+def test_fuzzy_ranks_consecutive_runs_first():
+    index = FuzzyIndex(
+        [
+            "Wait Until Page Contains Element",
+            "Wait Until Element Is Visible",
+            "Wait Until Element Is Enabled",
+        ]
+    )
+    assert index.find("waituntilelem")[2] == "Wait Until Page Contains Element"
+
+
+def test_index_groups():
+    index = PrefixIndex()
+    fuzzy = FuzzyIndex()
+    for group, names in [
+        ("BuiltIn", ["BuiltIn", "Log", "BuiltIn.Log"]),
+        ("Other", ["Other", "Log", "Log Many", "Other.Log"]),
+    ]:
+        index.set_group(group, names)
+        fuzzy.set_group(group, names)
+    assert list(index.find("log")) == ["Log", "Log Many"]
+    assert list(index.find("other.")) == ["Other.Log"]
+    assert fuzzy.find("lgmn") == ["Log Many"]
+
+    index.set_group("Other", ["Other", "Other.Log Two"])  # reloaded
+    fuzzy.set_group("Other", ["Other", "Other.Log Two"])
+    assert list(index.find("log")) == ["Log"]
+    assert fuzzy.find("oth.lgtw") == ["Other.Log Two"]
+
+
+def wait_indexed(completer):
+    thread = completer._indexing
+    if thread is not None:
+        thread.join()
+
+
+def test_failing_library_is_skipped(monkeypatch):
+    bad = SimpleNamespace(name="Bad", handlers=[])
+    good = SimpleNamespace(name="Good", handlers=[])
+    libs = [bad]
+
+    def library_commands(lib):
+        if lib is bad:
+            raise RuntimeError("no docs")
+        return [("Good", None), ("Good Keyword", None)]
+
+    monkeypatch.setattr(cmdcompleter, "get_libs", lambda: libs)
+    monkeypatch.setattr(cmdcompleter, "library_commands", library_commands)
+    completer = CmdCompleter(SimpleNamespace(get_helps=lambda: [("help", "help")]))
+    wait_indexed(completer)
+    assert completer.get_status() == ""
+
+    libs.append(good)
+    completer.update_libs()
+    wait_indexed(completer)
+    assert list(completer.index.find("good")) == ["Good", "Good Keyword"]
+    assert completer.get_status() == ""
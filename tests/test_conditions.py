@@ -0,0 +1,14 @@
+from DebugLibrary.conditions import _decorate_variables, compile_condition
+
+
+def test_decorate_variables():
+    assert _decorate_variables("$count > 3").startswith("RF_VAR_count ")
+    assert "RF_VAR_a" in _decorate_variables("$a == '$b'")
+    assert "RF_VAR_b" not in _decorate_variables("$a == '$b'")
+
+
+def test_compile_condition_once():
+    code = compile_condition("$count > 3")
+    assert compile_condition("$count > 3") is code
+    assert eval(code, {}, {"RF_VAR_count": 4})
+    assert not eval(compile_condition("1 > 3"), {})
@@ -82,10 +82,16 @@ def test_autocomplete(child):
     # check_prompt('DebugLibrary.\t', 'Debug If')
     check_prompt("get\t", "Get Count")
     check_prompt("get\t", "Get Time")
+    check_prompt("shbeeqasin\t", "Should Be Equal As Integers")  # fuzzy
     # check_prompt('selenium  http://google.com  \t', 'firefox.*chrome')
     # check_prompt('selenium  http://google.com  fire\t', 'firefox')
 
 
+def test_autocomplete_imported_library(child):
+    check_command("import library  String", "> ")
+    check_prompt("get subst\t", "Get Substring")
+
+
 def test_help(child):
     check_command("libs", "Imported libraries:.*DebugLibrary.*Builtin libraries:")
     check_command("help libs", "Print imported and builtin libraries,")
@@ -95,6 +101,10 @@ def test_help(child):
     check_command("k debuglibrary", "Debug")
     check_command("k nothing", "not found library")
     check_command("d Debug", "Open a interactive shell,")
+    check_command("d debuglibrary.debug_if", "Runs the Debug keyword if condition")
+    check_command("d nothing", "not find keyword")
+    check_command("search convert integer", "BuiltIn.Convert To Integer")
+    check_command("search zzzz", "not find keyword matching")
 
 
 def test_variables(child):
@@ -124,6 +134,24 @@ def test_debug_if(child):
     check_command("Debug If  ${secs} > 1", "Enter interactive shell")
     check_command("exit", "Exit shell.")
     check_command("Debug If  ${secs} < 1", "> ")
+    check_command("Debug If  $secs > 1", "Enter interactive shell")
+    check_command("exit", "Exit shell.")
+    check_command("Debug If  $secs < 1", "> ")
+
+
+def test_timeit(child):
+    check_command("timeit -n 3  Get Length  abc", "3 runs, 1 warmup,.*0 failed")
+    check_result("min .* median .* p95 .* max .* stdev ")
+    check_command("timeit -n 2 -w 0  Fail  no", "2 runs, 0 warmup,.*2 failed")
+    check_command("timeit -n", "-n needs a number")
+
+
+def test_profile(child):
+    check_command("profile", "not started")
+    check_command("profile start", "started")
+    check_command("profile show 3", "Hottest keywords")
+    check_command("profile export /nonexistent/dir/x.txt", "export failed")
+    check_command("profile stop", "stopped")
 
 
 def test_some_rf_core_keywords(child):
@@ -131,6 +159,28 @@ def test_some_rf_core_keywords(child):
     check_command("get time", ".*-.*-.* .*:.*:.*")
 
 
+def test_breakpoints(robot_child):
+    check_command("break step.robot:11  if  False", "Breakpoint .*1: step.robot:11")
+    check_command("b  create list", "Breakpoint .*2: create list")
+    check_command(
+        "c",  # continue
+        "Exit shell.*working.*"
+        "Breakpoint 2: create list .1 hits.*"
+        "/tests/step.robot.8.",
+    )
+    check_command("b", "1: step.robot:11  if  False .0 hits.*2: create list")
+    check_command("clear", "Deleted.*all breakpoints")
+
+
+def test_finish(robot_child):
+    check_command("until", "Please run `step` or `next` command first.")
+    check_command(
+        "finish",  # leaves test1, stops at the first keyword of test2
+        "working.*/tests/step.robot.11..*"
+        "=> BuiltIn.Log To Console  another test case",
+    )
+
+
 def test_step_functionality(robot_child):
     check_command("list", "Please run `step` or `next` command first.")
 
@@ -0,0 +1,79 @@
+from prompt_toolkit.history import FileHistory
+
+from DebugLibrary.history import (
+    FREQUENCY_WEIGHT,
+    BoundedFileHistory,
+    HistoryIndex,
+    read_lines_backwards,
+)
+
+
+def test_read_lines_backwards(tmp_path):
+    path = tmp_path / "lines"
+    path.write_bytes(b"one\ntwo\nthree")
+    assert list(read_lines_backwards(str(path), block_size=3)) == [
+        b"three",
+        b"two",
+        b"one",
+    ]
+
+
+def test_bounded_history(tmp_path):
+    path = str(tmp_path / "history")
+    history = FileHistory(path)
+    for command in ["a", "b", "multi\nline", "a", "c", "d"]:
+        history.store_string(command)
+
+    history = BoundedFileHistory(path, max_size=10)
+    assert list(history.load_history_strings()) == ["d", "c", "a", "multi\nline", "b"]
+
+    history = BoundedFileHistory(path, max_size=3)
+    assert list(history.load_history_strings()) == ["d", "c", "a"]
+    # older entries are dropped from the file
+    assert list(FileHistory(path).load_history_strings()) == ["d", "c", "a"]
+
+
+def test_compact_keeps_appended_entries(tmp_path):
+    path = str(tmp_path / "history")
+    for command in ["a", "b", "c", "d"]:
+        FileHistory(path).store_string(command)
+
+    history = BoundedFileHistory(path, max_size=2)
+    loading = history.load_history_strings()
+    assert next(loading) == "d"
+    FileHistory(path).store_string("e")  # another process
+    history.store_string("f")
+    assert list(loading) == ["c"]  # then compacts
+    assert list(FileHistory(path).load_history_strings()) == ["f", "e", "d", "c"]
+
+
+def test_history_index():
+    index = HistoryIndex()
+    for entry in ["log  often", "log  old", "log  often"]:
+        index.add_older(entry)  # newest first
+    assert index.find("log") == "log  often"
+    assert index.find("log  ol") == "log  old"
+    assert index.find("log  often") is None
+    assert index.find("nothing") is None
+
+    # a second use ranks like FREQUENCY_WEIGHT commands more recent
+    index.add("log  new")
+    assert index.find("log") == "log  often"
+    for _ in range(FREQUENCY_WEIGHT):
+        index.add("get time")
+    index.add("log  new")
+    assert index.find("log") == "log  new"
+    assert index.find("g") == "get time"
+
+
+def test_history_index_loaded(tmp_path):
+    path = str(tmp_path / "history")
+    for command in ["log  a", "log  b", "log  a"]:
+        FileHistory(path).store_string(command)
+    history = BoundedFileHistory(path)
+    list(history.load_history_strings())
+    history.store_string("log  c")
+    assert history.index.find("log  ") == "log  a"  # used twice
+    assert history.index.find("log  a") is None
+    history.store_string("log  c")
+    assert history.index.find("log  ") == "log  c"
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+# modules only a debug feature needs, never imported by the library alone
+DEFERRED = [
+    "prompt_toolkit",
+    "robot.libdocpkg",
+    "cmd",
+    "DebugLibrary.debugcmd",
+    "DebugLibrary.cmdcompleter",
+    "DebugLibrary.robotkeyword",
+]
+# generous bound of the library's own import time, in microseconds
+MAX_IMPORT_TIME = 100_000
+
+
+# what robot has loaded already by the time it imports a library
+ROBOT_SETUP = "import robot.running, robot.libraries.BuiltIn"
+
+
+def get_import_times(statement, setup=ROBOT_SETUP):
+    """Get cumulative import times of modules first imported by statement."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{setup}\n{statement}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    lines = process.stderr.splitlines()
+    # skip what the setup imported
+    start = max(
+        [
+            index
+            for index, line in enumerate(lines)
+            if setup and line.endswith(" robot.libraries.BuiltIn")
+        ],
+        default=0,
+    )
+    for line in lines[start + 1:]:
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_idle_import_cost():
+    times = get_import_times("from DebugLibrary import DebugLibrary")
+    imported = [
+        name
+        for name in times
+        for deferred in DEFERRED
+        if name == deferred or name.startswith(deferred + ".")
+    ]
+    assert imported == []
+    assert times["DebugLibrary"] < MAX_IMPORT_TIME
+
+
+def test_client_imports_no_robot():
+    times = get_import_times(
+        "from DebugLibrary.server import SOCKET_PATH, connect", setup=""
+    )
+    assert "DebugLibrary.server" in times
+    assert [name for name in times if name.split(".")[0] == "robot"] == []
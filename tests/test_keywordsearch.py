@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from DebugLibrary.keywordsearch import SearchIndex, tokenize
+
+
+def make_keyword(name, doc="", args=()):
+    return SimpleNamespace(name=name, lib="Some", doc=doc, args=list(args))
+
+
+KEYWORDS = [
+    make_keyword(
+        "Split String", "Splits the string using separator.", ["string", "sep=None"]
+    ),
+    make_keyword("Get Line Count", "Returns the number of lines.", ["string"]),
+    make_keyword(
+        "Replace String",
+        "Replaces pattern in the string.",
+        ["string", "search_for", "replace_with"],
+    ),
+]
+
+
+def test_tokenize():
+    assert tokenize("Should_Be Equal, `int`") == ["should", "be", "equal", "int"]
+
+
+def test_search_index():
+    index = SearchIndex()
+    library = SimpleNamespace(name="Some", handlers=[])
+    index.add_library(library, KEYWORDS)
+    assert [_.name for _ in index.search("split")] == ["Split String"]
+    assert index.search("sep")[0].name == "Split String"
+    assert [_.name for _ in index.search("string lines")] == ["Get Line Count"]
+    assert index.search("repl")[0].name == "Replace String"  # prefix
+    assert index.search("searc")[0].name == "Replace String"  # argument name
+    assert index.search("nothing") == []
+    assert index.search("") == []
+
+    index.add_library(library, KEYWORDS[:1])  # same library, not indexed again
+    assert index.search("lines")[0].name == "Get Line Count"
+
+
+def test_search_index_reloads():
+    index = SearchIndex()
+    library = SimpleNamespace(name="Some", handlers=[])
+    index.add_library(library, KEYWORDS)
+    for _ in range(10):
+        library.handlers = []  # reloaded
+        index.add_library(library, KEYWORDS[:2])
+        assert index.search("lines")[0].name == "Get Line Count"
+        assert index.search("replace") == []
+    assert index.live == 2
+    assert len(index.keywords) <= 2 * index.live
+    assert max(len(ids) for ids in index.postings["name"].values()) <= 2
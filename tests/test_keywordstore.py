@@ -0,0 +1,52 @@
+import os
+from types import SimpleNamespace
+
+from DebugLibrary import keywordstore
+from DebugLibrary.keywordstore import load_keywords, save_keywords
+
+KEYWORDS = [{"name": "Some Keyword", "doc": "", "args": []}]
+
+
+def make_library(tmp_path):
+    source = tmp_path / "Some.py"
+    source.write_text("def some_keyword(): pass\n")
+    return SimpleNamespace(
+        name="Some",
+        version="1.0",
+        source=str(source),
+        positional_args=[],
+        named_args=[],
+        handlers=[SimpleNamespace(name="Some Keyword")],
+    )
+
+
+def test_stored_keywords(tmp_path, monkeypatch):
+    monkeypatch.setattr(keywordstore, "CACHE_PATH", str(tmp_path / "cache"))
+    library = make_library(tmp_path)
+    assert load_keywords(library) is None
+    save_keywords(library, KEYWORDS)
+    assert load_keywords(library) == KEYWORDS
+
+    stat = os.stat(library.source)
+    os.utime(library.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert load_keywords(library) is None
+
+
+def test_new_version_replaces_stored_keywords(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(keywordstore, "CACHE_PATH", str(cache))
+    library = make_library(tmp_path)
+    save_keywords(library, KEYWORDS)
+    library.version = "2.0"
+    assert load_keywords(library) is None
+    save_keywords(library, KEYWORDS)
+    assert load_keywords(library) == KEYWORDS
+    assert len(list(cache.iterdir())) == 1
+
+
+def test_changed_keyword_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(keywordstore, "CACHE_PATH", str(tmp_path / "cache"))
+    library = make_library(tmp_path)
+    save_keywords(library, KEYWORDS)
+    library.handlers = library.handlers + [SimpleNamespace(name="Other Keyword")]
+    assert load_keywords(library) is None
@@ -0,0 +1,22 @@
+import pytest
+
+from DebugLibrary.keywordtimer import (
+    TimeitUsageError,
+    parse_timeit_args,
+    percentile,
+)
+
+
+def test_parse_timeit_args():
+    assert parse_timeit_args("Get Time") == (10, 1, False, "Get Time")
+    assert parse_timeit_args("-n 5 -w 0 -p  Log  -n") == (5, 0, True, "Log  -n")
+    for args in ["", "-n 5", "-n 0  Log  hi", "-n x  Log", "-x  Log"]:
+        with pytest.raises(TimeitUsageError):
+            parse_timeit_args(args)
+
+
+def test_percentile():
+    values = list(range(1, 21))
+    assert percentile(values, 95) == 19
+    assert percentile(values, 100) == 20
+    assert percentile([7], 95) == 7
@@ -0,0 +1,75 @@
+from DebugLibrary.profiler import KeywordProfiler, profile_name
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(profiler, clock, name, seconds, children=()):
+    profiler.start_keyword(name)
+    clock.now += seconds
+    for child in children:
+        run(profiler, clock, *child)
+    profiler.end_keyword()
+
+
+def test_self_and_total_time():
+    clock = FakeClock()
+    profiler = KeywordProfiler(clock=clock)
+    for _ in range(2):
+        run(profiler, clock, "Outer", 1, [("Sleep", 3), ("Log", 0.5)])
+    run(profiler, clock, "Sleep", 2)
+
+    assert profiler.hottest_keywords(2) == [
+        (8.0, 8.0, 3, "Sleep"),
+        (2.0, 9.0, 2, "Outer"),
+    ]
+    assert profiler.hottest_paths(1) == [(6.0, 2, ("Outer", "Sleep"))]
+    assert sorted(profiler.collapsed_stacks()) == [
+        "Outer 2000000",
+        "Outer;Log 1000000",
+        "Outer;Sleep 6000000",
+        "Sleep 2000000",
+    ]
+
+
+def test_pause_excludes_time():
+    clock = FakeClock()
+    profiler = KeywordProfiler(clock=clock)
+    profiler.start_keyword("Outer")
+    clock.now += 1
+    profiler.pause()
+    profiler.start_keyword("Shell")  # not profiled while paused
+    clock.now += 100
+    profiler.end_keyword()
+    profiler.resume()
+    clock.now += 1
+    profiler.end_keyword()
+    profiler.end_keyword()  # started before profiling
+
+    assert profiler.hottest_keywords(5) == [(2.0, 2.0, 1, "Outer")]
+
+
+def test_node_limit():
+    clock = FakeClock()
+    profiler = KeywordProfiler(max_nodes=2, clock=clock)
+    for name in ["a", "b", "c", "d"]:
+        run(profiler, clock, name, 1)
+
+    assert profiler.nodes == 3
+    assert sorted(path for _, _, path in profiler.hottest_paths(5)) == [
+        ("(other)",),
+        ("a",),
+        ("b",),
+    ]
+    assert profiler.hottest_keywords(1) == [(2.0, 2.0, 2, "(other)")]
+
+
+def test_profile_name():
+    assert profile_name("BuiltIn.Log", {"type": "Keyword"}) == "BuiltIn.Log"
+    assert profile_name("${i} IN RANGE", {"type": "FOR"}) == "FOR"
+    assert profile_name("Setup", {}) == "Setup"
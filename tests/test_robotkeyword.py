@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from robot.running.testlibraries import TestLibrary
+
+from DebugLibrary import keywordstore, robotkeyword
+from DebugLibrary.robotkeyword import (
+    KeywordCache,
+    find_keyword,
+    get_lib_keywords,
+    normalize_name,
+)
+
+
+def make_library(name, version="1.0"):
+    return SimpleNamespace(name=name, version=version, source=None, handlers=[])
+
+
+def make_keywords(library, *names):
+    return [SimpleNamespace(name=name, lib=library.name) for name in names]
+
+
+def test_keyword_cache_identity():
+    cache = KeywordCache()
+    library = make_library("Some")
+    keywords = make_keywords(library, "Some Keyword")
+    cache.add(library, keywords)
+    assert cache.get(library) is keywords
+    assert cache.get_names(library)[normalize_name("some_keyword")] == keywords
+
+    library.handlers = []  # reloaded
+    assert cache.get(library) is None
+    assert cache.get_names(library) is None
+
+    cache.add(library, keywords)
+    assert cache.get(make_library("Some")) is None  # imported again
+
+
+def test_keyword_cache_lru():
+    cache = KeywordCache(max_size=2)
+    first, second, third = [make_library(name) for name in ("A", "B", "C")]
+    for library in (first, second):
+        cache.add(library, make_keywords(library, library.name))
+    cache.get(first)
+    cache.add(third, make_keywords(third, "C"))
+    assert cache.get(second) is None
+    assert cache.get(first) is not None
+    assert cache.get_names(third) == {"c": cache.get(third)}
+
+
+def test_find_keyword_with_bounded_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(keywordstore, "CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.setattr(robotkeyword, "_keyword_cache", KeywordCache(max_size=2))
+    libraries = [TestLibrary(name) for name in ("BuiltIn", "Collections", "String")]
+    monkeypatch.setattr(robotkeyword, "get_libs", lambda: libraries)
+
+    for name in ("Should Be Equal", "builtin.should_be_equal", "Split String"):
+        keywords = find_keyword(name)
+        assert len(keywords) == 1, name
+    assert find_keyword("Collections.Append To List")[0].lib == "Collections"
+
+
+def test_library_keywords(tmp_path, monkeypatch):
+    monkeypatch.setattr(keywordstore, "CACHE_PATH", str(tmp_path / "cache"))
+    monkeypatch.setattr(robotkeyword, "_keyword_cache", KeywordCache())
+    library = TestLibrary("String")
+    keyword = next(_ for _ in get_lib_keywords(library) if _.name == "Split String")
+    assert keyword.summary.startswith("Splits the ``string``")
+    assert keyword.args[0] == "string"
+    assert not hasattr(keyword, "__dict__")
+
+    library = TestLibrary("String")  # imported again
+    keyword = next(_ for _ in get_lib_keywords(library) if _.name == "Split String")
+    assert keyword.doc.startswith("Splits the ``string``")  # from the store
@@ -0,0 +1,48 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+
+import pexpect
+
+
+def run_client(env, commands):
+    return subprocess.run(
+        [sys.executable, "DebugLibrary/shell.py", "--connect"],
+        input="".join(f"{command}\n" for command in commands),
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+        timeout=10,
+    ).stdout
+
+
+def test_server(tmp_path):
+    path = str(tmp_path / "rfdebug.sock")
+    env = dict(os.environ, RFDEBUG_SOCKET=path)
+    server = pexpect.spawn(
+        sys.executable, ["DebugLibrary/shell.py", "--server"], env=env
+    )
+    server.expect("Serving debug shell", timeout=10)
+    try:
+        output = run_client(env, ["${x} =  Set Variable  42", "log to console  hi"])
+        assert "${x} = '42'" in output
+        assert "hi" in output
+
+        # state is kept across clients, exit only ends the session
+        output = run_client(env, ["${x}", "exit", "log to console  never"])
+        assert "42" in output
+        assert "never" not in output
+
+        # invalid bytes do not bring the server down
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+            client.sendall(b"\xff\xfe\n")
+            assert client.recv(65536)
+        output = run_client(env, ["${x}"])
+        assert "42" in output
+    finally:
+        server.kill(signal.SIGINT)
+        server.expect(pexpect.EOF, timeout=10)
+    assert not os.path.exists(path)
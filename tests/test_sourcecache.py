@@ -0,0 +1,38 @@
+import os
+
+from DebugLibrary import sourcecache
+from DebugLibrary.sourcecache import get_source_file, get_source_line
+
+
+def write(path, text):
+    with open(path, "w") as source:
+        source.write(text)
+
+
+def test_lines(tmp_path):
+    path = str(tmp_path / "some.robot")
+    write(path, "first\r\nsecond\n\nlast")
+    lines = get_source_file(path)
+    assert len(lines) == 4
+    assert lines[:] == ["first", "second", "", "last"]
+    assert lines[-1] == "last"
+    assert get_source_line(path, 2) == "second"
+
+
+def test_invalidated_when_changed(tmp_path):
+    path = str(tmp_path / "some.robot")
+    write(path, "one\n")
+    lines = get_source_file(path)
+    assert get_source_file(path) is lines
+    write(path, "one\ntwo\n")
+    os.utime(path, ns=(0, lines.mtime + 1))
+    assert get_source_line(path, 2) == "two"
+
+
+def test_large_file_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(sourcecache, "MMAP_THRESHOLD", 10)
+    path = str(tmp_path / "large.robot")
+    write(path, "".join(f"line {i}\n" for i in range(5000)))
+    lines = get_source_file(path)
+    assert lines._mmap is not None
+    assert lines[4999] == "line 4999"
@@ -0,0 +1,27 @@
+from DebugLibrary.sourcelines import get_block_index
+
+SUITE = """\
+*** Test Cases ***
+test1
+    FOR  ${i}  IN RANGE  3
+        Log  ${i}
+# comment at column 0
+    END
+    Log  a
+    ...  continued
+
+*** Keywords ***
+My Keyword
+    Log  b
+"""
+
+
+def test_block_index(tmp_path):
+    path = tmp_path / "some.robot"
+    path.write_text(SUITE)
+    index = get_block_index(str(path))
+    assert index.find(5) == (2, 8)
+    assert index.find(8) == (2, 8)
+    assert index.find(9) is None
+    assert index.find(12) == (11, 12)
+    assert get_block_index(str(path)) is index
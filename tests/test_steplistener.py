@@ -0,0 +1,31 @@
+from DebugLibrary.globals import context
+from DebugLibrary.steplistener import StepListener
+
+
+def at(listener, depth, lineno, source="suite.robot"):
+    listener.depth = depth
+    return listener.is_step_reached({"source": source, "lineno": lineno})
+
+
+def test_step_depth(monkeypatch):
+    listener = StepListener(None)
+    monkeypatch.setattr(context, "step_until", None)
+
+    monkeypatch.setattr(context, "step_depth", None)  # step
+    assert at(listener, 5, 1)
+
+    monkeypatch.setattr(context, "step_depth", 2)  # next at depth 2
+    assert not at(listener, 3, 1)
+    assert at(listener, 2, 1)
+    assert at(listener, 1, 1)
+
+
+def test_step_until(monkeypatch):
+    listener = StepListener(None)
+    monkeypatch.setattr(context, "step_depth", 2)
+    monkeypatch.setattr(context, "step_until", ("suite.robot", 10))
+
+    assert not at(listener, 2, 8)
+    assert not at(listener, 3, 12)
+    assert at(listener, 2, 10)
+    assert at(listener, 1, 4, source="other.robot")